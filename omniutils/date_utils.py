@@ -32,6 +32,11 @@ MONTH_PARSER = {
     "dezembro": 12,
 }
 
+# Busca usada por `to_datetime`: os nomes de `MONTH_PARSER` e as grafias sem
+# acento, pré-calculadas aqui para que a conversão seja uma única consulta ao
+# dicionário, sem normalizar o nome a cada chamada
+_MONTH_LOOKUP = {**MONTH_PARSER, "marco": 3}
+
 DataOuString = Union[str, date, datetime]
 
 
@@ -49,7 +54,8 @@ class DateUtils:
         Este método converte o nome do mês (em formato de string, como
         "janeiro", "fevereiro", etc.) para o número correspondente (1 para
         janeiro, 2 para fevereiro, etc.) utilizando o dicionário `MONTH_PARSER`.
-         Se o nome do mês não for encontrado no dicionário, um ValueError é
+        A grafia sem acento ("marco") e letras maiúsculas também são aceitas.
+        Se o nome do mês não for encontrado no dicionário, um ValueError é
         levantado.
 
         Parâmetros:
@@ -75,7 +81,7 @@ class DateUtils:
         ```
         """
         # Converte o mês para número
-        month_number = MONTH_PARSER.get(month.lower())
+        month_number = _MONTH_LOOKUP.get(month.lower())
         if not month_number:
             raise ValueError(f"Nome do mês '{month}' inválido.")
 
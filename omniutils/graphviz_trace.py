@@ -1,8 +1,14 @@
+import fnmatch
 import functools
+import inspect
 import logging
 import os
+import re
+import threading
 from abc import ABC, abstractmethod  # pylint: disable=no-name-in-module
-from typing import Callable
+from contextlib import contextmanager
+from typing import Callable, Optional
+from weakref import WeakKeyDictionary
 
 from pycallgraph2 import (  # type: ignore
     Color,
@@ -12,9 +18,83 @@ from pycallgraph2 import (  # type: ignore
     PyCallGraph,
 )
 from pycallgraph2.output import GraphvizOutput  # type: ignore
+from pyinstrument import Profiler  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Instâncias de GraphvizOutput e Config de cada classe de rastreamento,
+# indexadas pela própria classe. O lock garante que cada instância seja criada
+# uma única vez, mesmo quando várias threads as solicitam ao mesmo tempo.
+_graphviz_cache: "WeakKeyDictionary[type, GraphvizOutput]" = WeakKeyDictionary()
+_config_cache: "WeakKeyDictionary[type, Config]" = WeakKeyDictionary()
+_cache_lock = threading.RLock()
+
+# Estado do rastreamento por thread. Usado para não iniciar um rastreamento
+# aninhado quando já há um PyCallGraph (`active`) ou um Profiler do
+# pyinstrument (`sampling`) ativo na mesma thread.
+_trace_state = threading.local()
+
+
+class CompiledGlobbingFilter(GlobbingFilter):
+    """
+    GlobbingFilter que compila os padrões de inclusão e exclusão em uma única
+    expressão regular para cada lista.
+
+    O GlobbingFilter original avalia cada padrão com `fnmatch`, um a um, a
+    cada chamada rastreada. Como o filtro é chamado para todo evento do
+    rastreamento, esta classe substitui as N chamadas a `fnmatch` por uma
+    única correspondência de regex compilada. A semântica é a mesma: os
+    padrões de exclusão são avaliados primeiro e, em seguida, os de inclusão.
+
+    Exemplos de uso:
+    ```python
+    trace_filter = CompiledGlobbingFilter(
+        include=["meupacote.*"], exclude=["meupacote.testes.*"]
+    )
+    trace_filter("meupacote.modulo.funcao")  # True
+    ```
+    """
+
+    def __init__(self, include=None, exclude=None):
+        super().__init__(include=include, exclude=exclude)
+        self._include_regex = self._compile(self.include)
+        self._exclude_regex = self._compile(self.exclude)
+
+    @staticmethod
+    def _compile(patterns) -> Optional[re.Pattern]:
+        if not patterns:
+            return None
+        return re.compile(
+            "|".join(
+                fnmatch.translate(os.path.normcase(pattern))
+                for pattern in patterns
+            )
+        )
+
+    @classmethod
+    def from_filter(cls, trace_filter: GlobbingFilter):
+        """
+        Cria um CompiledGlobbingFilter a partir de um GlobbingFilter existente.
+
+        Parâmetros:
+            trace_filter (GlobbingFilter): Filtro cujos padrões serão
+                compilados.
+
+        Retorna:
+            CompiledGlobbingFilter: Filtro equivalente com padrões compilados.
+        """
+        if isinstance(trace_filter, cls):
+            return trace_filter
+        return cls(include=trace_filter.include, exclude=trace_filter.exclude)
+
+    def __call__(self, full_name=None):
+        full_name = os.path.normcase(full_name)
+        if self._exclude_regex and self._exclude_regex.match(full_name):
+            return False
+        return bool(
+            self._include_regex and self._include_regex.match(full_name)
+        )
+
 
 class GraphTracerAbstract(ABC):
     """
@@ -41,16 +121,21 @@ class GraphTracerAbstract(ABC):
         - get_config() -> Config:
             Retorna a configuração (Config) para o pycallgraph2, com filtros e
             agrupadores.
+        - trace(label) -> ContextManager:
+            Context manager que gera um diagrama de rastreamento do bloco
+            `with`.
         - trace_graph(func) -> Callable:
             Decorator que gera um diagrama de rastreamento da execução da funçã
             o decorada.
+        - trace_graph_sampled(func, interval) -> Callable:
+            Decorator que gera um relatório de profiling por amostragem da
+            execução da função decorada.
+        - unwrap(func) -> Callable:
+            Retorna a função original, removendo os decorators aplicados.
     """
 
-    graphviz: GraphvizOutput = None
-    config: Config = None
-
-    @abstractmethod
     @classmethod
+    @abstractmethod
     def get_trace_filter(cls) -> GlobbingFilter:
         """
         Define e retorna o filtro de rastreamento para o pycallgraph2.
@@ -62,8 +147,8 @@ class GraphTracerAbstract(ABC):
             GlobbingFilter: Objeto que configura os filtros de rastreamento.
         """
 
-    @abstractmethod
     @classmethod
+    @abstractmethod
     def get_trace_grouper(cls) -> Grouper:
         """
         Define e retorna o agrupador para o pycallgraph2.
@@ -128,10 +213,13 @@ class GraphTracerAbstract(ABC):
         print(graphviz.output_file)  # Exibe o arquivo de saída configurado
         ```
         """
-        if cls.graphviz is None:
-            cls.graphviz = GraphvizOutput()
-            cls.graphviz.node_color_func = cls.rainbow
-        return cls.graphviz
+        with _cache_lock:
+            graphviz = _graphviz_cache.get(cls)
+            if graphviz is None:
+                graphviz = GraphvizOutput()
+                graphviz.node_color_func = cls.rainbow
+                _graphviz_cache[cls] = graphviz
+            return graphviz
 
     @classmethod
     def get_config(cls) -> Config:
@@ -141,7 +229,9 @@ class GraphTracerAbstract(ABC):
 
         Se a configuração ainda não estiver definida, cria uma nova instância
         de Config, atribuindo os filtros e agrupadores definidos pelos métodos
-        abstratos `get_trace_filter()` e `get_trace_grouper()`.
+        abstratos `get_trace_filter()` e `get_trace_grouper()`. Filtros do tipo
+        GlobbingFilter são convertidos em `CompiledGlobbingFilter`. A instância
+        é única por classe e sua criação é protegida por lock.
 
         Retorna:
             Config: Instância de configuração para pycallgraph2.
@@ -154,12 +244,96 @@ class GraphTracerAbstract(ABC):
         print(config.trace_filter)
         ```
         """
-        if cls.config is None:
-            config = Config()
-            config.trace_filter = cls.get_trace_filter()
-            config.trace_grouper = cls.get_trace_grouper()
-            cls.config = config
-        return cls.config
+        with _cache_lock:
+            config = _config_cache.get(cls)
+            if config is None:
+                config = Config()
+                trace_filter = cls.get_trace_filter()
+                if isinstance(trace_filter, GlobbingFilter):
+                    trace_filter = CompiledGlobbingFilter.from_filter(
+                        trace_filter
+                    )
+                config.trace_filter = trace_filter
+                config.trace_grouper = cls.get_trace_grouper()
+                _config_cache[cls] = config
+            return config
+
+    @staticmethod
+    def unwrap(func: Callable) -> Callable:
+        """
+        Retorna a função original de uma função decorada, seguindo a cadeia de
+        atributos `__wrapped__` definidos por `functools.wraps`.
+
+        Útil para profilers e depuradores atribuírem o tempo de execução ao
+        frame correto quando há vários decorators aninhados.
+
+        Parâmetros:
+            func (Callable): A função decorada.
+
+        Retorna:
+            Callable: A função original, sem decorators.
+
+        Exemplos de uso:
+        ```python
+        @MyGraphTracer.trace_graph
+        def minha_funcao(x, y):
+            return x + y
+
+        original = MyGraphTracer.unwrap(minha_funcao)
+        print(original(3, 4))  # Executa sem rastreamento. Saída: 7
+        ```
+        """
+        return inspect.unwrap(func)
+
+    @classmethod
+    @contextmanager
+    def trace(cls, label: str):
+        """
+        Context manager que gera um diagrama de rastreamento (call graph) do
+        trecho de código executado dentro do bloco `with`.
+
+        Permite rastrear apenas uma região de interesse, em vez da função
+        inteira, e é a base do decorator `trace_graph`. O diagrama é salvo em um
+        arquivo PNG cujo nome é derivado de `label`. Blocos aninhados na mesma
+        thread não iniciam um novo rastreamento: suas chamadas já fazem parte
+        do diagrama externo.
+
+        Parâmetros:
+            label (str): Rótulo do diagrama e nome (sem extensão) do arquivo de
+                saída.
+
+        Exemplos de uso:
+        ```python
+        with MyGraphTracer.trace("etl"):
+            extrair()
+            transformar()
+        # O diagrama de rastreamento será salvo em 'etl.png'
+        ```
+        """
+        if getattr(_trace_state, "active", False):
+            # Já existe um rastreamento ativo nesta thread, que inclui as
+            # chamadas deste bloco. Um PyCallGraph aninhado substituiria o
+            # tracer externo (sys.settrace) e corromperia os dois diagramas.
+            logger.debug("Graphviz - trace de %s já incluído no atual.", label)
+            yield
+            return
+
+        graphviz = cls.get_graphviz()
+        graphviz.output_file = f"{label}.png"
+        graphviz.graph_attributes["graph"]["label"] = label
+
+        logger.debug("Graphviz - gerando diagrama do trace de %s...", label)
+
+        _trace_state.active = True
+        try:
+            with PyCallGraph(output=graphviz, config=cls.get_config()):
+                yield
+        finally:
+            _trace_state.active = False
+
+        logger.debug(
+            "Diagrama salvo em %s", os.path.abspath(graphviz.output_file)
+        )
 
     @classmethod
     def trace_graph(cls, func: Callable):
@@ -210,22 +384,93 @@ class GraphTracerAbstract(ABC):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             full_method_name = f"{func.__module__}.{func.__qualname__}"
+            with cls.trace(full_method_name):
+                return func(*args, **kwargs)
 
-            graphviz = cls.get_graphviz()
-            graphviz.output_file = f"{full_method_name}.png"
-            graphviz.graph_attributes["graph"]["label"] = full_method_name
+        return wrapper
 
-            logger.debug(
-                "Graphviz - gerando diagrama do trace da função %s...",
-                full_method_name,
-            )
+    @classmethod
+    def trace_graph_sampled(
+        cls, func: Optional[Callable] = None, *, interval: float = 0.001
+    ):
+        """
+        Decorator que gera um relatório de profiling por amostragem da
+        execução da função decorada.
+
+        Diferente de `trace_graph`, que registra deterministicamente todas as
+        chamadas de funções (custo proporcional ao número de chamadas), este
+        decorator usa o pyinstrument para amostrar a pilha de chamadas a cada
+        `interval` segundos (custo proporcional ao tempo de execução). É
+        indicado para funções de longa duração, onde o rastreamento completo
+        seria muito custoso. O relatório é salvo em um arquivo HTML cujo nome é
+        derivado do nome completo da função (módulo + qualname). Se a função
+        levantar uma exceção, nenhum relatório é gerado.
 
-            with PyCallGraph(output=graphviz, config=cls.get_config()):
-                result = func(*args, **kwargs)
+        Parâmetros:
+            func (Callable): A função a ser rastreada.
+            interval (float): Intervalo de amostragem, em segundos. Padrão:
+                0.001.
 
-            logger.debug(
-                "Diagrama salvo em %s", os.path.abspath(graphviz.output_file)
-            )
-            return result
+        Retorna:
+            Callable: A função decorada que, ao ser chamada, gera o relatório
+            de profiling.
 
-        return wrapper
+        Exemplos de uso:
+        ```python
+        @MyGraphTracer.trace_graph_sampled
+        def minha_funcao(x, y):
+            return x + y
+
+        @MyGraphTracer.trace_graph_sampled(interval=0.01)
+        def processamento_longo():
+            ...
+
+        minha_funcao(3, 4)
+        # O relatório será salvo em 'meumodulo.minha_funcao.html'
+        ```
+        """
+
+        def decorator(func: Callable):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                full_method_name = f"{func.__module__}.{func.__qualname__}"
+                if getattr(_trace_state, "sampling", False):
+                    # Já existe um Profiler ativo nesta thread, que inclui as
+                    # amostras desta chamada. O pyinstrument não permite
+                    # iniciar um segundo Profiler na mesma thread.
+                    logger.debug(
+                        "Pyinstrument - amostragem de %s já incluída na atual.",
+                        full_method_name,
+                    )
+                    return func(*args, **kwargs)
+
+                output_file = f"{full_method_name}.html"
+
+                logger.debug(
+                    "Pyinstrument - gerando relatório por amostragem da função "
+                    "%s...",
+                    full_method_name,
+                )
+
+                profiler = Profiler(interval=interval)
+                profiler.start()
+                _trace_state.sampling = True
+                try:
+                    result = func(*args, **kwargs)
+                finally:
+                    _trace_state.sampling = False
+                    profiler.stop()
+                # O relatório é gerado apenas se a função terminar sem erro:
+                # uma falha ao gravá-lo não pode substituir a exceção da função
+                profiler.write_html(output_file)
+
+                logger.debug(
+                    "Relatório salvo em %s", os.path.abspath(output_file)
+                )
+                return result
+
+            return wrapper
+
+        if func is None:
+            return decorator
+        return decorator(func)
@@ -1,4 +1,20 @@
+import functools
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, List, Optional
+
+import msgspec
+
+
+@functools.cache
+def _decoder_for(schema: Any) -> msgspec.json.Decoder:
+    """
+    Retorna um decodificador JSON do msgspec especializado para o schema
+    informado. O decodificador é criado uma única vez por schema e reutilizado
+    nas chamadas seguintes.
+    """
+    return msgspec.json.Decoder(schema)
 
 
 class JsonOperator:
@@ -41,6 +57,104 @@ class JsonOperator:
         except json.JSONDecodeError as error:
             raise ValueError(f"Erro ao decodificar JSON: {error}") from error
 
+    @staticmethod
+    def load_json_many(
+        caminhos_arquivos: Iterable[str], max_workers: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Lê vários arquivos JSON em paralelo, utilizando um pool de threads, e
+        retorna seus conteúdos na mesma ordem dos caminhos informados.
+
+        A leitura dos arquivos é limitada por I/O, de modo que as threads
+        sobrepõem a latência de disco de cada arquivo. Cada arquivo é lido por
+        `load_json` de forma independente, sem estado compartilhado entre as
+        threads, e os dicionários retornados não são compartilhados entre
+        chamadas.
+
+        Parâmetros
+        ----------
+        caminhos_arquivos : Iterable[str]
+            Os caminhos dos arquivos JSON que serão lidos.
+        max_workers : int, opcional
+            Número máximo de threads. Por padrão, usa
+            `min(32, os.cpu_count() * 2)`.
+
+        Retorna
+        -------
+        List[dict]
+            O conteúdo de cada arquivo JSON, na ordem de `caminhos_arquivos`.
+
+        Exceções
+        --------
+        Propaga a primeira exceção levantada por `load_json`
+        (FileNotFoundError ou ValueError), na ordem dos caminhos.
+
+        Exemplo
+        -------
+        ```
+        conteudos = load_json_many(["a.json", "b.json"])
+        print(conteudos[0])
+        ```
+
+        """
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(JsonOperator.load_json, caminhos_arquivos))
+
+    @staticmethod
+    def load_json_as(caminho_arquivo: str, schema: Any) -> Any:
+        """
+        Lê um arquivo JSON e decodifica seu conteúdo diretamente para o schema
+        informado, validando os tipos durante a decodificação.
+
+        O decodificador do msgspec é construído uma única vez para cada schema
+        e reutilizado nas chamadas seguintes, o que torna este método indicado
+        para ler muitos arquivos com a mesma estrutura.
+
+        Parâmetros
+        ----------
+        caminho_arquivo : str
+            O caminho para o arquivo JSON que será lido.
+        schema : Any
+            O tipo esperado do conteúdo, como uma subclasse de
+            `msgspec.Struct`, um dataclass, um TypedDict ou um tipo genérico
+            (ex.: `list[dict[str, int]]`). Deve ser hashable.
+
+        Retorna
+        -------
+        Any
+            O conteúdo do arquivo JSON, decodificado como uma instância de
+            `schema`.
+
+        Exceções
+        --------
+        Levanta FileNotFoundError se o arquivo não for encontrado.
+        Levanta ValueError se o conteúdo do arquivo não for um JSON válido ou
+        não corresponder ao schema.
+
+        Exemplo
+        -------
+        ```
+        class Pessoa(msgspec.Struct):
+            nome: str
+            idade: int
+
+        pessoa = load_json_as("pessoa.json", Pessoa)
+        print(pessoa.nome)
+        ```
+
+        """
+        try:
+            with open(caminho_arquivo, "rb") as arquivo:
+                return _decoder_for(schema).decode(arquivo.read())
+        except FileNotFoundError as error:
+            raise FileNotFoundError(
+                f"Arquivo não encontrado: {caminho_arquivo}"
+            ) from error
+        except msgspec.DecodeError as error:
+            raise ValueError(f"Erro ao decodificar JSON: {error}") from error
+
     @staticmethod
     def save_json(caminho_arquivo: str, conteudo: dict):
         """
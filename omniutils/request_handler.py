@@ -1,14 +1,31 @@
+import asyncio
+import functools
 import logging
 import os
+import shutil
+import socket
+import threading
 import time
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
 from http.client import IncompleteRead
-from typing import Dict, Optional
+from typing import (
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import htmldate  # type: ignore
+import httpx
 import requests
-import requests_cache  # type: ignore
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 from requests.adapters import HTTPAdapter
 from requests.exceptions import (
     ChunkedEncodingError,
@@ -20,8 +37,9 @@ from requests.exceptions import (
     RequestException,
     Timeout,
 )
-from requests_cache import CachedSession
+from requests_cache import CachedSession, SQLiteDict
 from urllib3 import Retry
+from urllib3.exceptions import ProtocolError
 
 from .check_settings import check_settings
 from .file_operator import FileOperator
@@ -34,29 +52,124 @@ requests_cache_expire_after_days = (
     settings.get_requests_cache_expire_after_days()
 )
 
-# Configuração do cache
-requests_cache.install_cache("request_http_cache", backend="sqlite")
-
 TIMEOUT_CONNECT = 10
 TIMEOUT_READ = 20
+# Endereço (host, porta) usado por padrão para verificar o acesso à internet:
+# o DNS público da Cloudflare, que aceita conexões TCP na porta 53
+INTERNET_CHECK_ADDRESS = ("1.1.1.1", 53)
+# Período (segundos) durante o qual uma verificação de acesso à internet
+# bem-sucedida é reaproveitada por `get_last_modified`
+INTERNET_CHECK_TTL = 60
+# Número máximo de URLs cuja data de modificação fica memorizada
+LAST_MODIFIED_CACHE_SIZE = 4096
+# Número máximo de páginas analisadas (BeautifulSoup) mantidas em memória
+SOUP_CACHE_SIZE = 256
+DEFAULT_POOL_SIZE = 32
+# Número máximo de requisições simultâneas em `get_many` e `download_many`
+DEFAULT_CONCURRENCY = 16
+# Tamanho dos blocos (bytes) copiados da resposta para o arquivo em download
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Tempo máximo (ms) que uma conexão SQLite aguarda um lock de escrita antes de
+# falhar com "database is locked"
+SQLITE_BUSY_TIMEOUT = 5000
+# PRAGMAs adicionais aplicados às conexões SQLite do cache de requisições
+SQLITE_PRAGMAS = {
+    "cache_size": -20000,  # ~20 MB de cache de páginas em memória
+    "temp_store": "MEMORY",  # Tabelas e índices temporários em memória
+    "mmap_size": 268435456,  # Leitura do arquivo via mmap (até 256 MB)
+}
 DEFAULT_RETRIES = 3
 DEFAULT_BACKOFF_FACTOR = 0.5
-DEFAULT_STATUS_FORCELIST = [
-    429,  # Too Many Requests -  Indica que o cliente enviou muitas requisições
-    # em um curto período de tempo.
-    500,  # Internal Server Error -  Um erro genérico indicando que o servidor
-    # encontrou uma condição inesperada que impediu o processamento da
-    # requisição.
-    502,  # Bad Gateway -  Indica que o servidor (ou gateway) recebeu uma
-    # resposta inválida do servidor upstream (servidor de origem).
-    503,  # Service Unavailable -  O servidor está temporariamente indisponível,
-    # geralmente devido a manutenção ou sobrecarga.
-    504,  # Gateway Timeout - Indica que o servidor (ou gateway) não recebeu uma
-    # resposta do servidor upstream dentro do tempo limite.
-    520,  # Web Server Is Returning an Unknown Erro - este é um código de status
-    # não padrão gerado pelo Cloudflare. Indica um problema desconhecido na
-    # comunicação entre o Cloudflare e o servidor de origem.
-]
+DEFAULT_STATUS_FORCELIST = frozenset(
+    {
+        429,  # Too Many Requests -  Indica que o cliente enviou muitas
+        # requisições em um curto período de tempo.
+        500,  # Internal Server Error -  Um erro genérico indicando que o
+        # servidor encontrou uma condição inesperada que impediu o
+        # processamento da requisição.
+        502,  # Bad Gateway -  Indica que o servidor (ou gateway) recebeu uma
+        # resposta inválida do servidor upstream (servidor de origem).
+        503,  # Service Unavailable -  O servidor está temporariamente
+        # indisponível, geralmente devido a manutenção ou sobrecarga.
+        504,  # Gateway Timeout - Indica que o servidor (ou gateway) não
+        # recebeu uma resposta do servidor upstream dentro do tempo limite.
+        520,  # Web Server Is Returning an Unknown Erro - este é um código de
+        # status não padrão gerado pelo Cloudflare. Indica um problema
+        # desconhecido na comunicação entre o Cloudflare e o servidor de
+        # origem.
+    }
+)
+# Métodos HTTP para os quais o retry é aplicado
+DEFAULT_ALLOWED_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+
+# Estratégia de retry padrão (backoff exponencial), criada uma única vez. As
+# estratégias personalizadas por chamada são derivadas dela com `Retry.new`.
+_DEFAULT_RETRY = Retry(
+    total=DEFAULT_RETRIES,
+    backoff_factor=DEFAULT_BACKOFF_FACTOR,
+    status_forcelist=DEFAULT_STATUS_FORCELIST,
+    allowed_methods=DEFAULT_ALLOWED_METHODS,
+)
+
+# Sessão HTTP sem cache usada apenas para verificar o acesso à internet. É
+# compartilhada entre as verificações para reaproveitar a conexão (keep-alive).
+_probe_session = requests.Session()
+
+
+class _DateNotFoundError(LookupError):
+    """
+    Levantada por `RequestHandler._find_date` quando a data não é encontrada.
+    Exceções não são memorizadas pelo `lru_cache`, então uma falha
+    (temporária ou não) é tentada novamente na próxima chamada.
+    """
+
+
+class RetryHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter cuja estratégia de retry pode ser substituída temporariamente
+    na thread atual, sem alterar o adaptador compartilhado pela sessão.
+
+    O adaptador é montado uma única vez na sessão, preservando o pool de
+    conexões (keep-alive) entre as requisições. Requisições que precisam de
+    uma estratégia de retry diferente da padrão usam `override_retries`, que
+    vale apenas para a thread que o chamou.
+
+    Exemplos de uso:
+    ```python
+    adapter = RetryHTTPAdapter(max_retries=Retry(total=3))
+    session.mount("https://", adapter)
+
+    with adapter.override_retries(Retry(total=10)):
+        session.get("https://example.com")
+    ```
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._local = threading.local()
+        super().__init__(*args, **kwargs)
+
+    @property  # type: ignore[override]
+    def max_retries(self) -> Retry:
+        local = self.__dict__.get("_local")
+        retry = getattr(local, "retry", None)
+        return retry if retry is not None else self._default_max_retries
+
+    @max_retries.setter
+    def max_retries(self, value: Retry):
+        self._default_max_retries = value
+
+    @contextmanager
+    def override_retries(self, retry: Optional[Retry]):
+        """
+        Substitui a estratégia de retry na thread atual durante o bloco
+        `with`. Se `retry` for None, mantém a estratégia padrão.
+        """
+        previous = getattr(self._local, "retry", None)
+        self._local.retry = retry
+        try:
+            yield
+        finally:
+            self._local.retry = previous
 
 
 class RequestHandler:
@@ -68,6 +181,10 @@ class RequestHandler:
     Métodos:
         - get_session() -> requests.Session:
             Retorna uma sessão HTTP configurada com cache.
+        - bulk_scrape() -> Iterator[None]:
+            Agrupa as gravações no cache de requisições em uma transação.
+        - get_http2_client(verify: bool) -> httpx.Client:
+            Retorna um cliente HTTP com suporte a HTTP/2.
         - request_with_retry(url: str,
                              method: str, **kwargs) -> requests.Response:
             Realiza uma requisição HTTP com retry automático.
@@ -77,9 +194,21 @@ class RequestHandler:
                         headers: Optional[Dict]) -> str:
             Faz o download de um arquivo a partir de uma URL e o salva
             localmente.
-        - get_soap_by_url(url: str) -> BeautifulSoup:
+        - get_many(urls: Sequence[str], concurrency: int)
+                -> List[httpx.Response]:
+            Realiza, de forma assíncrona e concorrente, requisições GET para
+            várias URLs.
+        - download_many(downloads: Sequence[Tuple[str, str]],
+                        concurrency: int) -> List[str]:
+            Faz, de forma assíncrona e concorrente, o download de vários
+            arquivos.
+        - get_soap_by_url(url: str, only_tags: Optional[Sequence[str]],
+                          reuse_tree: bool) -> BeautifulSoup:
             Retorna um objeto BeautifulSoup com o conteúdo HTML obtido de uma
             URL.
+        - get_elements_streaming(url: str, tags: Sequence[str])
+                -> Iterator[etree._Element]:
+            Retorna, à medida que são analisados, os elementos HTML de uma URL.
         - get_soap_from_file(file_path: str) -> BeautifulSoup:
             Lê um arquivo HTML e retorna um objeto BeautifulSoup.
         - check_internet_access(url: str, timeout: int) -> bool:
@@ -89,12 +218,25 @@ class RequestHandler:
     """
 
     _session = None
+    _session_lock = threading.Lock()
+    _internet_checked_at: Optional[float] = None
+    _soup_cache: "OrderedDict[Hashable, BeautifulSoup]" = OrderedDict()
+    _soup_cache_lock = threading.Lock()
+    _http2_clients: Dict[bool, httpx.Client] = {}
 
     @classmethod
     def get_session(cls):
         """
         Retorna uma sessão HTTP configurada com cache.
 
+        A sessão é criada uma única vez, de forma segura entre threads, com um
+        adaptador HTTP que aplica a estratégia de retry padrão e mantém um pool
+        de conexões reutilizado por todas as requisições.
+
+        O cache é armazenado em SQLite no modo WAL, com `busy_timeout` e os
+        PRAGMAs de `SQLITE_PRAGMAS`, permitindo seu uso por várias threads sem
+        erros de "database is locked".
+
         Parâmetros:
             Nenhum.
 
@@ -108,43 +250,168 @@ class RequestHandler:
         print(response.status_code)
         ```
         """
+        # Verificação dupla: o lock só é adquirido enquanto a sessão ainda não
+        # existe, e garante que ela seja criada uma única vez
         if cls._session is None:
-            session = CachedSession(
-                "request_http_cache",
-                # Habilita o uso do diretório de cache padrão do usuário
-                # (dependente do sistema operacional
-                use_cache_dir=True,
-                # Respeita, prioritariamente os cabeçalhos Cache-Control das
-                # respostas HTTP, se existir, para determinar a validade do
-                # cache.
-                cache_control=True,
-                # Define o tempo de expiração do cache para um período de dias.
-                # Se `cache_control=True`, o tempo de expiração será ignorado.
-                expire_after=timedelta(days=requests_cache_expire_after_days),
-                # Define os códigos HTTP que serão armazenados no cache. No
-                # caso, respostas com código 200 (sucesso) e 400 (erro do
-                # cliente) serão armazenadas.
-                allowable_codes=[200, 400],
-                # Define os métodos HTTP cujas respostas serão armazenadas no
-                # cache
-                allowable_methods=["GET", "POST"],
-                # Exclui o parâmetro api_key ao comparar requisições para
-                # verificar se uma resposta armazenada pode ser usada. Isso
-                # impede que chaves de API diferentes invalidem o cache.
-                ignored_parameters=["api_key"],
-                # Inclui o cabeçalho Accept-Language como critério para
-                # diferenciar as respostas no cache. Por exemplo, respostas para
-                # diferentes idiomas serão armazenadas separadamente.
-                match_headers=["Accept-Language"],
-                # Quando ocorre um erro de requisição (como falha na conexão
-                # ou timeout), o sistema usa dados do cache considerados
-                # "obsoletos", se disponíveis. Isso evita interrupções no
-                # serviço, mesmo que os dados estejam desatualizados.
-                stale_if_error=True,
-            )
-            cls._session = session
+            with cls._session_lock:
+                if cls._session is None:
+                    cls._session = cls._build_session()
         return cls._session
 
+    @classmethod
+    @contextmanager
+    def bulk_scrape(cls) -> Iterator[None]:
+        """
+        Agrupa em uma única transação SQLite todas as respostas gravadas no
+        cache de requisições dentro do bloco `with`, em vez de uma transação
+        (e uma sincronização com o disco) por requisição.
+
+        Enquanto o bloco estiver ativo, o cache fica reservado para a thread
+        que o abriu: use-o em laços sequenciais de requisições, não em
+        requisições feitas por várias threads. Para backends de cache que não
+        sejam SQLite, não tem efeito.
+
+        Parâmetros:
+            Nenhum.
+
+        Exemplos de uso:
+        ```python
+        with RequestHandler.bulk_scrape():
+            for url in urls:
+                RequestHandler.request_with_retry(url)
+        ```
+        """
+        responses = cls.get_session().cache.responses
+        with (
+            responses.bulk_commit()
+            if isinstance(responses, SQLiteDict)
+            else nullcontext()
+        ):
+            yield
+
+    @classmethod
+    def _build_session(cls) -> CachedSession:
+        """
+        Cria a sessão HTTP com cache retornada por `get_session`, com o
+        adaptador de retry e o pool de conexões já configurados.
+        """
+        session = CachedSession(
+            "request_http_cache",
+            # Habilita o uso do diretório de cache padrão do usuário
+            # (dependente do sistema operacional
+            use_cache_dir=True,
+            # Respeita, prioritariamente os cabeçalhos Cache-Control das
+            # respostas HTTP, se existir, para determinar a validade do
+            # cache.
+            cache_control=True,
+            # Define o tempo de expiração do cache para um período de dias.
+            # Se `cache_control=True`, o tempo de expiração será ignorado.
+            expire_after=timedelta(days=requests_cache_expire_after_days),
+            # Define os códigos HTTP que serão armazenados no cache. No
+            # caso, respostas com código 200 (sucesso) e 400 (erro do
+            # cliente) serão armazenadas.
+            allowable_codes=[200, 400],
+            # Define os métodos HTTP cujas respostas serão armazenadas no
+            # cache
+            allowable_methods=["GET", "POST"],
+            # Exclui o parâmetro api_key ao comparar requisições para
+            # verificar se uma resposta armazenada pode ser usada. Isso
+            # impede que chaves de API diferentes invalidem o cache.
+            ignored_parameters=["api_key"],
+            # Inclui o cabeçalho Accept-Language como critério para
+            # diferenciar as respostas no cache. Por exemplo, respostas para
+            # diferentes idiomas serão armazenadas separadamente.
+            match_headers=["Accept-Language"],
+            # Quando ocorre um erro de requisição (como falha na conexão
+            # ou timeout), o sistema usa dados do cache considerados
+            # "obsoletos", se disponíveis. Isso evita interrupções no
+            # serviço, mesmo que os dados estejam desatualizados.
+            stale_if_error=True,
+            # Modo WAL: leituras e escritas ocorrem em paralelo e o
+            # sincronismo com o disco passa a ser "NORMAL"
+            wal=True,
+            # Aguarda o lock de escrita em vez de falhar imediatamente com
+            # "database is locked" quando há várias threads/processos
+            busy_timeout=SQLITE_BUSY_TIMEOUT,
+        )
+        cls._tune_sqlite_cache(session.cache)
+
+        # Adaptador com a estratégia de retry padrão, montado uma única vez
+        # para preservar o pool de conexões
+        adapter = RetryHTTPAdapter(
+            max_retries=_DEFAULT_RETRY,
+            pool_connections=DEFAULT_POOL_SIZE,
+            pool_maxsize=DEFAULT_POOL_SIZE,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        return session
+
+    @staticmethod
+    def _tune_sqlite_cache(cache) -> None:
+        """
+        Aplica os PRAGMAs de `SQLITE_PRAGMAS` às conexões SQLite do cache de
+        requisições (tabelas de respostas e de redirecionamentos). Backends de
+        cache que não sejam SQLite são ignorados.
+        """
+        for table in (cache.responses, cache.redirects):
+            if not isinstance(table, SQLiteDict):
+                continue
+            with table.connection() as connection:
+                for pragma, value in SQLITE_PRAGMAS.items():
+                    connection.execute(f"PRAGMA {pragma}={value}")
+
+    @classmethod
+    def get_http2_client(cls, verify: bool = False) -> httpx.Client:
+        """
+        Retorna um cliente HTTP com suporte a HTTP/2, usado por
+        `request_with_retry(..., use_http2=True)`.
+
+        Em servidores compatíveis, as requisições concorrentes para um mesmo
+        host são multiplexadas em uma única conexão TLS, em vez de exigir uma
+        conexão (e um handshake) por requisição. Há um cliente por valor de
+        `verify`, criado uma única vez e compartilhado entre as threads.
+
+        Parâmetros:
+            - verify (bool): Verificação do certificado SSL. Padrão: False.
+
+        Retorna:
+            - httpx.Client: Cliente HTTP/2 com pool de conexões.
+
+        Exemplos de uso:
+        ```python
+        client = RequestHandler.get_http2_client()
+        response = client.get("https://example.com")
+        print(response.http_version)
+        ```
+        """
+        client = cls._http2_clients.get(verify)
+        if client is None:
+            with cls._session_lock:
+                client = cls._http2_clients.get(verify)
+                if client is None:
+                    limits = httpx.Limits(
+                        max_connections=DEFAULT_POOL_SIZE,
+                        max_keepalive_connections=DEFAULT_POOL_SIZE,
+                    )
+                    client = httpx.Client(
+                        http2=True,
+                        verify=verify,
+                        limits=limits,
+                        # Refaz a tentativa em falhas de conexão; os códigos
+                        # de `status_forcelist` são tratados em
+                        # `_request_http2`
+                        transport=httpx.HTTPTransport(
+                            http2=True,
+                            verify=verify,
+                            limits=limits,
+                            retries=DEFAULT_RETRIES,
+                        ),
+                    )
+                    cls._http2_clients[verify] = client
+        return client
+
     @classmethod
     def request_with_retry(
         cls,
@@ -156,10 +423,17 @@ class RequestHandler:
         Realiza uma requisição HTTP com tentativas automáticas de retry em caso
         de falhas transitórias.
 
+        Com `use_http2=True`, a requisição é feita pelo cliente de
+        `get_http2_client`, sem passar pelo cache de requisições, e retorna um
+        `httpx.Response` (com `status_code`, `headers`, `content`, `text` e
+        `json()`, como `requests.Response`). As falhas continuam sendo
+        levantadas com as exceções de `requests`.
+
         Parâmetros:
             - url (str): A URL para a requisição.
-            - method (str): Método HTTP a ser utilizado ("GET", "POST", "PUT"
-                ou "DELETE").
+            - method (str): Método HTTP a ser utilizado (ex.: "GET", "POST",
+                "PUT" ou "DELETE"). Repassado diretamente a
+                `session.request`.
             - **kwargs: Argumentos adicionais para a requisição, como:
                 * data (dict): Dados para requisições POST/PUT.
                 * json (dict): Dados JSON para requisições POST/PUT.
@@ -172,6 +446,7 @@ class RequestHandler:
                 * retries (int): Número de tentativas.
                 * backoff_factor (float): Fator de espera entre tentativas.
                 * status_forcelist (list): Lista de códigos HTTP para retry.
+                * use_http2 (bool): Usa o cliente HTTP/2. Padrão: False.
 
         Retorna:
             - requests.Response: Objeto de resposta HTTP resultante da
@@ -188,6 +463,8 @@ class RequestHandler:
         print(response.json())
         ```
         """
+        if kwargs.get("use_http2", False):
+            return cls._request_http2(url, method, **kwargs)
 
         # Define opções padrão
         verify = kwargs.get("verify", False)
@@ -198,29 +475,29 @@ class RequestHandler:
         params = kwargs.get("params", None)
         timeout_connect = kwargs.get("timeout_connect", TIMEOUT_CONNECT)
         timeout_read = kwargs.get("timeout_read", TIMEOUT_READ)
-        retries = kwargs.get("retries", DEFAULT_RETRIES)
-        backoff_factor = kwargs.get("backoff_factor", DEFAULT_BACKOFF_FACTOR)
-        status_forcelist = kwargs.get(
-            "status_forcelist", DEFAULT_STATUS_FORCELIST
-        )
 
-        # Criação e configuração da sessão HTTP
         session = cls.get_session()
 
-        # Configuração da estratégia de retry com backoff exponencial
-        retry_strategy = Retry(
-            total=retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=status_forcelist,
-            allowed_methods=["GET", "POST", "PUT", "DELETE"],
-            # Métodos suportados para retry
+        # A estratégia de retry padrão já está no adaptador da sessão. Uma
+        # estratégia própria só é criada se o chamador a personalizou.
+        retry_strategy = None
+        if {"retries", "backoff_factor", "status_forcelist"} & kwargs.keys():
+            retry_strategy = _DEFAULT_RETRY.new(
+                total=kwargs.get("retries", DEFAULT_RETRIES),
+                backoff_factor=kwargs.get(
+                    "backoff_factor", DEFAULT_BACKOFF_FACTOR
+                ),
+                status_forcelist=kwargs.get(
+                    "status_forcelist", DEFAULT_STATUS_FORCELIST
+                ),
+            )
+        adapter = session.get_adapter(url)
+        retry_context = (
+            adapter.override_retries(retry_strategy)
+            if isinstance(adapter, RetryHTTPAdapter)
+            else nullcontext()
         )
 
-        # Adaptador HTTP com a estratégia de retry
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
         try:
             logger.debug(
                 "Realizando %s em %s ... kwargs: %s ...",
@@ -229,32 +506,19 @@ class RequestHandler:
                 str(kwargs),
             )
 
-            # Mapeamento de métodos HTTP suportados
-            http_methods = {
-                "GET": session.get,
-                "POST": session.post,
-                "PUT": session.put,
-                "DELETE": session.delete,
-            }
-
-            # Verifica se o método HTTP fornecido é válido
-            if method.upper() not in http_methods:
-                raise ValueError(
-                    f"Método HTTP inválido: {method}. Use 'GET', 'POST', 'PUT' "
-                    f"ou 'DELETE'."
-                )
-
             # Realiza a requisição HTTP de acordo com o método especificado
-            response = http_methods[method.upper()](
-                url,
-                headers=headers,
-                params=params,
-                data=data,
-                json=json_data,
-                verify=verify,
-                stream=stream,
-                timeout=(timeout_connect, timeout_read),
-            )
+            with retry_context:
+                response = session.request(
+                    method.upper(),
+                    url,
+                    headers=headers,
+                    params=params,
+                    data=data,
+                    json=json_data,
+                    verify=verify,
+                    stream=stream,
+                    timeout=(timeout_connect, timeout_read),
+                )
 
             # Tratamento especial para código 429 (Too Many Requests)
             if response.status_code == 429:
@@ -303,11 +567,91 @@ class RequestHandler:
             logger.error("Erro geral de requisição ao acessar %s. %s", url, err)
             raise
 
+    @classmethod
+    def _request_http2(cls, url: str, method: str = "GET", **kwargs):
+        """
+        Implementa `request_with_retry(..., use_http2=True)`, com os mesmos
+        argumentos, convertendo as exceções do httpx nas equivalentes de
+        `requests`.
+        """
+        retries = kwargs.get("retries", DEFAULT_RETRIES)
+        backoff_factor = kwargs.get("backoff_factor", DEFAULT_BACKOFF_FACTOR)
+        status_forcelist = kwargs.get(
+            "status_forcelist", DEFAULT_STATUS_FORCELIST
+        )
+        client = cls.get_http2_client(kwargs.get("verify", False))
+        request = client.build_request(
+            method.upper(),
+            url,
+            headers=kwargs.get("headers", {}),
+            params=kwargs.get("params", None),
+            data=kwargs.get("data", None),
+            json=kwargs.get("json", None),
+            timeout=httpx.Timeout(
+                kwargs.get("timeout_read", TIMEOUT_READ),
+                connect=kwargs.get("timeout_connect", TIMEOUT_CONNECT),
+            ),
+        )
+
+        logger.debug(
+            "Realizando %s (HTTP/2) em %s ... kwargs: %s ...",
+            method,
+            url,
+            str(kwargs),
+        )
+        try:
+            for attempt in range(retries + 1):
+                response = client.send(
+                    request, stream=kwargs.get("stream", False)
+                )
+                if (
+                    response.status_code not in status_forcelist
+                    or attempt == retries
+                ):
+                    break
+                response.close()
+                time.sleep(backoff_factor * (2**attempt))
+        except httpx.TimeoutException as err:
+            logger.warning("Tempo limite excedido. Erro: %s ", err)
+            raise requests.exceptions.Timeout(err) from err
+        except httpx.TransportError as err:
+            logger.warning(
+                "Erro de conexão ao acessar o servidor. Erro: %s", err
+            )
+            raise RequestsConnectionError(err) from err
+
+        if response.is_error:
+            logger.error(
+                "Erro HTTP ao acessar %s. Código: %s",
+                url,
+                response.status_code,
+            )
+            raise requests.exceptions.HTTPError(
+                f"{response.status_code} Error for url: {url}",
+                response=response,
+            )
+
+        logger.debug(
+            "Requisição %s (%s) para %s bem-sucedida!",
+            method,
+            response.http_version,
+            url,
+        )
+        return response
+
     @classmethod
     def get_last_modified(cls, url: str) -> Optional[datetime]:
         """
-        Obtém a data de última modificação de uma página web utilizando
-        htmldate.
+        Obtém a data de última modificação de uma página web.
+
+        Primeiro é feita uma requisição HEAD, e, se o servidor informar o
+        cabeçalho Last-Modified, a data é obtida dele, sem baixar a página.
+        Caso contrário, a data é identificada pelo htmldate a partir do
+        conteúdo da página.
+
+        O resultado é memorizado por URL, e a verificação de acesso à internet
+        é reaproveitada por `INTERNET_CHECK_TTL` segundos, de modo que chamadas
+        repetidas não geram novas requisições.
 
         Parâmetros:
             - url (str): A URL da página web.
@@ -328,8 +672,11 @@ class RequestHandler:
         ```
         """
         try:
-            RequestHandler.check_internet_access()
-            date_str = htmldate.find_date(url, outputformat="%Y-%m-%d")
+            cls._ensure_internet_access()
+            try:
+                date_str = cls._find_date(url)
+            except _DateNotFoundError:
+                date_str = None
             last_modified = None  # Define como None inicialmente
 
             if date_str:
@@ -353,6 +700,61 @@ class RequestHandler:
             logger.error("Erro ao processar a data obtida: %s", val_err)
             raise
 
+    @classmethod
+    def _ensure_internet_access(cls) -> None:
+        """
+        Verifica o acesso à internet com `check_internet_access`, reaproveitando
+        uma verificação bem-sucedida por `INTERNET_CHECK_TTL` segundos.
+        """
+        now = time.monotonic()
+        checked_at = cls._internet_checked_at
+        if checked_at is not None and now - checked_at < INTERNET_CHECK_TTL:
+            return
+        cls.check_internet_access()
+        cls._internet_checked_at = now
+
+    @classmethod
+    @functools.lru_cache(maxsize=LAST_MODIFIED_CACHE_SIZE)
+    def _find_date(cls, url: str) -> str:
+        """
+        Retorna a data de modificação da página, no formato "%Y-%m-%d",
+        obtida do cabeçalho Last-Modified ou, na sua ausência, identificada
+        pelo htmldate. Apenas as datas encontradas são memorizadas por URL:
+        se nenhuma for encontrada, levanta `_DateNotFoundError`.
+        """
+        date_str = cls._get_header_last_modified(url)
+        if date_str:
+            return date_str
+        date_str = htmldate.find_date(url, outputformat="%Y-%m-%d")
+        if not date_str:
+            raise _DateNotFoundError(url)
+        return date_str
+
+    @classmethod
+    def _get_header_last_modified(cls, url: str) -> Optional[str]:
+        """
+        Retorna a data do cabeçalho Last-Modified da página, no formato
+        "%Y-%m-%d", obtida com uma requisição HEAD, ou None se o servidor não
+        informar o cabeçalho (ou a requisição falhar).
+        """
+        try:
+            response = cls.get_session().head(
+                url,
+                timeout=(TIMEOUT_CONNECT, TIMEOUT_READ),
+                allow_redirects=True,
+            )
+        except RequestException as err:
+            logger.debug("HEAD em %s falhou: %s", url, err)
+            return None
+        header = response.headers.get("Last-Modified")
+        if response.status_code >= 400 or not header:
+            return None
+        try:
+            return parsedate_to_datetime(header).strftime("%Y-%m-%d")
+        except (TypeError, ValueError):
+            logger.debug("Last-Modified inválido em %s: %s", url, header)
+            return None
+
     @classmethod
     def download_file(
         cls, url: str, filename_path: str, headers: Optional[Dict] = None
@@ -386,33 +788,41 @@ class RequestHandler:
             headers = {}  # Inicializa o dicionário se não for fornecido
         # Garante que os diretórios intermediários existem
         os.makedirs(os.path.dirname(filename_path), exist_ok=True)
+        # Sanitiza o nome do arquivo para evitar problemas com caracteres
+        # inválidos
+        filename_path = FileOperator.sanitize_filename(filename_path)
 
         start_time = time.time()
         logger.debug(
             "Realizando o download do arquivo para %s ...", filename_path
         )
-        response = None
         try:
             retry_count = 3  # Número de tentativas para IncompleteRead
             while retry_count > 0:
                 try:
-                    response = cls.request_with_retry(
+                    # A resposta de cada tentativa é fechada ao sair do bloco,
+                    # inclusive quando a leitura falha no meio
+                    with cls.request_with_retry(
                         url, stream=True, headers=headers
-                    )
-                    # Sanitiza o nome do arquivo para evitar problemas
-                    # com caracteres inválidos
-                    filename_path = FileOperator.sanitize_filename(
-                        filename_path
-                    )
-                    with open(filename_path, "wb") as file_wb:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:  # Filtra chunks keep-alive vazios
-                                file_wb.write(chunk)
+                    ) as response, open(
+                        filename_path, "wb", buffering=DOWNLOAD_CHUNK_SIZE
+                    ) as file_wb:
+                        # Copia o stream bruto diretamente para o arquivo, em
+                        # blocos grandes, descompactando gzip/deflate se
+                        # necessário
+                        response.raw.decode_content = True
+                        shutil.copyfileobj(
+                            response.raw, file_wb, length=DOWNLOAD_CHUNK_SIZE
+                        )
 
                     return (
                         filename_path  # Download bem-sucedido, saindo do loop
                     )
-                except (ChunkedEncodingError, IncompleteRead) as err:
+                except (
+                    ChunkedEncodingError,
+                    IncompleteRead,
+                    ProtocolError,
+                ) as err:
                     logger.warning(
                         "IncompleteRead error: %s. Retentando... %d/3",
                         err,
@@ -431,29 +841,251 @@ class RequestHandler:
             end_time = time.time()
             processing_time = end_time - start_time
             logger.debug("Tempo decorrido: %.2f segundos", processing_time)
-            if response:
-                response.close()
 
         # Retorno no caso de falha, fora do try-finally
         return filename_path  # Ou, dependendo do caso, `return ""`
 
+    @staticmethod
+    def _build_async_client(verify: bool = False) -> httpx.AsyncClient:
+        """
+        Cria o cliente assíncrono (HTTP/2) usado por `get_many` e
+        `download_many`. Um cliente assíncrono fica associado ao event loop em
+        que é usado, por isso é criado a cada chamada e compartilhado apenas
+        entre as requisições dela.
+        """
+        limits = httpx.Limits(
+            max_connections=DEFAULT_POOL_SIZE,
+            max_keepalive_connections=DEFAULT_POOL_SIZE,
+        )
+        return httpx.AsyncClient(
+            http2=True,
+            verify=verify,
+            limits=limits,
+            timeout=httpx.Timeout(TIMEOUT_READ, connect=TIMEOUT_CONNECT),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                verify=verify,
+                limits=limits,
+                retries=DEFAULT_RETRIES,
+            ),
+        )
+
+    @classmethod
+    async def get_many(
+        cls,
+        urls: Sequence[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        headers: Optional[Dict] = None,
+        verify: bool = False,
+    ) -> List[httpx.Response]:
+        """
+        Realiza requisições GET para várias URLs de forma assíncrona, com até
+        `concurrency` requisições simultâneas, de modo que o tempo total seja
+        limitado pela requisição mais lenta, e não pela soma de todas.
+
+        As requisições não passam pelo cache de requisições de `get_session`.
+        Falhas de conexão são tentadas novamente até `DEFAULT_RETRIES` vezes.
+
+        Parâmetros:
+            - urls (Sequence[str]): As URLs a serem acessadas.
+            - concurrency (int): Número máximo de requisições simultâneas.
+                Padrão: `DEFAULT_CONCURRENCY`.
+            - headers (Optional[Dict]): Cabeçalhos HTTP enviados em todas as
+                requisições.
+            - verify (bool): Verificação do certificado SSL. Padrão: False.
+
+        Retorna:
+            - List[httpx.Response]: As respostas, na mesma ordem de `urls`. O
+                código de status não é verificado.
+
+        Exceções:
+            - RequestsConnectionError: Se não for possível conectar a alguma
+                das URLs.
+            - Timeout: Se alguma requisição exceder o tempo limite.
+
+        Exemplos de uso:
+        ```python
+        import asyncio
+        responses = asyncio.run(
+            RequestHandler.get_many(["https://example.com/a",
+                                     "https://example.com/b"]))
+        print([response.status_code for response in responses])
+        ```
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with cls._build_async_client(verify) as client:
+
+            async def fetch(url: str) -> httpx.Response:
+                async with semaphore:
+                    return await client.get(url, headers=headers)
+
+            try:
+                return await asyncio.gather(*(fetch(url) for url in urls))
+            except httpx.TimeoutException as err:
+                logger.warning("Tempo limite excedido. Erro: %s ", err)
+                raise requests.exceptions.Timeout(err) from err
+            except httpx.TransportError as err:
+                logger.warning(
+                    "Erro de conexão ao acessar o servidor. Erro: %s", err
+                )
+                raise RequestsConnectionError(err) from err
+
     @classmethod
-    def get_soap_by_url(cls, url: str) -> BeautifulSoup:
+    async def download_many(
+        cls,
+        downloads: Sequence[Tuple[str, str]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        headers: Optional[Dict] = None,
+        verify: bool = False,
+    ) -> List[str]:
+        """
+        Faz o download de vários arquivos de forma assíncrona, com até
+        `concurrency` downloads simultâneos.
+
+        Assim como em `download_file`, os diretórios intermediários são criados
+        e o nome de cada arquivo é sanitizado. A escrita dos blocos em disco é
+        feita em threads, sem bloquear o event loop.
+
+        Uma falha em um download não interrompe os demais: todos terminam
+        antes de a exceção do primeiro que falhou (na ordem de `downloads`)
+        ser levantada, e o arquivo incompleto de cada download com falha é
+        excluído.
+
+        Parâmetros:
+            - downloads (Sequence[Tuple[str, str]]): Pares (URL, caminho
+                completo onde o arquivo será salvo).
+            - concurrency (int): Número máximo de downloads simultâneos.
+                Padrão: `DEFAULT_CONCURRENCY`.
+            - headers (Optional[Dict]): Cabeçalhos HTTP enviados em todas as
+                requisições.
+            - verify (bool): Verificação do certificado SSL. Padrão: False.
+
+        Retorna:
+            - List[str]: Os caminhos dos arquivos baixados, na mesma ordem de
+                `downloads`.
+
+        Exceções:
+            - HTTPError: Se o servidor responder com um código de erro. Como
+                em `request_with_retry` com `use_http2=True`, a exceção é a de
+                `requests`, mas o seu atributo `response` é um
+                `httpx.Response`.
+            - RequestsConnectionError: Se não for possível conectar a alguma
+                das URLs.
+            - Timeout: Se algum download exceder o tempo limite.
+
+        Exemplos de uso:
+        ```python
+        import asyncio
+        paths = asyncio.run(
+            RequestHandler.download_many([
+                ("https://example.com/a.pdf", "/path/to/a.pdf"),
+                ("https://example.com/b.pdf", "/path/to/b.pdf"),
+            ]))
+        print(paths)
+        ```
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with cls._build_async_client(verify) as client:
+
+            async def download(url: str, filename_path: str) -> str:
+                # Garante que os diretórios intermediários existem
+                os.makedirs(os.path.dirname(filename_path), exist_ok=True)
+                filename_path = FileOperator.sanitize_filename(filename_path)
+                async with semaphore, client.stream(
+                    "GET", url, headers=headers
+                ) as response:
+                    if response.is_error:
+                        raise requests.exceptions.HTTPError(
+                            f"{response.status_code} Error for url: {url}",
+                            response=response,
+                        )
+                    try:
+                        with open(
+                            filename_path, "wb", buffering=DOWNLOAD_CHUNK_SIZE
+                        ) as file_wb:
+                            async for chunk in response.aiter_bytes(
+                                DOWNLOAD_CHUNK_SIZE
+                            ):
+                                await asyncio.to_thread(file_wb.write, chunk)
+                    except BaseException:
+                        # Não deixa um arquivo truncado no disco (também se o
+                        # download for cancelado)
+                        FileOperator.delete_file(filename_path)
+                        raise
+                return filename_path
+
+            try:
+                # Aguarda todos os downloads, mesmo após uma falha, e só então
+                # levanta a primeira exceção
+                results = await asyncio.gather(
+                    *(download(url, path) for url, path in downloads),
+                    return_exceptions=True,
+                )
+                paths = []
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+                    paths.append(result)
+                return paths
+            except httpx.TimeoutException as err:
+                logger.warning("Tempo limite excedido. Erro: %s ", err)
+                raise requests.exceptions.Timeout(err) from err
+            except httpx.TransportError as err:
+                logger.warning(
+                    "Erro de conexão ao acessar o servidor. Erro: %s", err
+                )
+                raise RequestsConnectionError(err) from err
+
+    @classmethod
+    def get_soap_by_url(
+        cls,
+        url: str,
+        only_tags: Optional[Sequence[str]] = None,
+        reuse_tree: bool = False,
+    ) -> BeautifulSoup:
         """
         Realiza uma requisição HTTP para a URL fornecida e retorna um objeto
         BeautifulSoup para análise do HTML.
 
         Parâmetros:
             - url (str): A URL da página web a ser acessada.
+            - only_tags (Optional[Sequence[str]]): Se informado, apenas os
+                elementos com essas tags (e seus descendentes) são incluídos
+                na árvore, por meio de um `SoupStrainer`, reduzindo o tempo e a
+                memória da análise de páginas grandes. Padrão: None (página
+                completa).
+            - reuse_tree (bool): Se True, reaproveita a árvore já analisada
+                quando o conteúdo da página não mudou (ver Observação). Padrão:
+                False (uma nova árvore a cada chamada).
 
         Retorna:
             - BeautifulSoup: Objeto BeautifulSoup representando o conteúdo HTML
               da página.
 
+        Observação:
+            Com `reuse_tree=True`, quando a resposta vem do cache de
+            requisições ou traz um ETag, a árvore analisada é guardada (até
+            `SOUP_CACHE_SIZE` páginas) e o mesmo objeto é retornado nas
+            próximas chamadas com `reuse_tree=True` e o mesmo conteúdo. Esse
+            objeto é compartilhado entre chamadas e threads: não o modifique
+            (`decompose`, `extract`, `clear` etc.); use `copy.copy(soup)` se
+            precisar alterá-lo.
+
+            Com `only_tags`, a árvore não contém a estrutura do documento
+            (`html`, `head`, `body`): os elementos selecionados ficam
+            diretamente na raiz, e elementos aninhados em outro elemento
+            selecionado aparecem apenas dentro dele.
+
         Exemplos de uso:
         ```python
         soup = RequestHandler.get_soap_by_url("https://example.com")
         print(soup.title.text)
+
+        soup = RequestHandler.get_soap_by_url(
+            "https://example.com", only_tags=["title", "meta"])
+        print(soup.title.text)
         ```
         """
         # Realiza a requisição HTTP para a URL e obtém a resposta
@@ -462,8 +1094,151 @@ class RequestHandler:
         # Verifica se a resposta contém conteúdo HTML válido
         # Em caso de erro, `fetch_data_with_retry` já lidará com as exceções
 
+        # Reaproveita a árvore já analisada quando o conteúdo não mudou
+        key = cls._get_soup_cache_key(url, response) if reuse_tree else None
+        if key is not None:
+            # Árvores filtradas por tags diferentes são guardadas separadamente
+            key = (key, tuple(only_tags) if only_tags else None)
+            with cls._soup_cache_lock:
+                soup = cls._soup_cache.get(key)
+                if soup is not None:
+                    cls._soup_cache.move_to_end(key)
+                    return soup
+
         # Retorna o conteúdo da página web como um objeto BeautifulSoup
-        return BeautifulSoup(response.content, "html.parser")
+        strainer = SoupStrainer(list(only_tags)) if only_tags else None
+        # Informa a codificação declarada pelo servidor, evitando que o
+        # BeautifulSoup tente detectá-la analisando todo o conteúdo
+        soup = BeautifulSoup(
+            response.content,
+            "lxml",
+            parse_only=strainer,
+            from_encoding=cls._get_declared_encoding(response),
+        )
+
+        if key is not None:
+            with cls._soup_cache_lock:
+                cls._soup_cache[key] = soup
+                cls._soup_cache.move_to_end(key)
+                while len(cls._soup_cache) > SOUP_CACHE_SIZE:
+                    cls._soup_cache.popitem(last=False)
+        return soup
+
+    @staticmethod
+    def _get_soup_cache_key(
+        url: str, response: requests.Response
+    ) -> Optional[Hashable]:
+        """
+        Retorna a chave que identifica o conteúdo de uma resposta no cache de
+        páginas analisadas, ou None se o conteúdo não puder ser identificado.
+
+        A chave usa o ETag da resposta, quando presente; caso contrário, para
+        respostas vindas do cache de requisições, usa a chave do cache e a data
+        em que a resposta foi armazenada, que muda quando a página é baixada
+        novamente.
+
+        Parâmetros:
+            - url (str): A URL da página web acessada.
+            - response (requests.Response): A resposta da requisição.
+
+        Retorna:
+            - Optional[Hashable]: A chave do conteúdo ou None.
+        """
+        etag = response.headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            return url, etag
+        if getattr(response, "from_cache", False):
+            return response.cache_key, response.created_at
+        return None
+
+    @classmethod
+    def get_elements_streaming(
+        cls,
+        url: str,
+        tags: Sequence[str] = ("a", "title"),
+        chunk_size: int = 65536,
+    ) -> Iterator[etree._Element]:
+        """
+        Realiza uma requisição HTTP em streaming para a URL fornecida e retorna,
+        à medida que são analisados, os elementos HTML com as tags informadas.
+
+        Diferente de `get_soap_by_url`, que aguarda todo o conteúdo da resposta
+        e constrói a árvore HTML completa, este método alimenta um parser
+        incremental do lxml com os blocos recebidos. O primeiro elemento fica
+        disponível assim que o bloco que o contém é recebido, e o consumo de
+        memória permanece limitado, pois cada elemento é descartado após ser
+        processado.
+
+        Parâmetros:
+            - url (str): A URL da página web a ser acessada.
+            - tags (Sequence[str]): Tags dos elementos a serem retornados.
+                Padrão: ("a", "title").
+            - chunk_size (int): Tamanho, em bytes, dos blocos lidos da
+                resposta. Padrão: 65536.
+
+        Retorna:
+            - Iterator[etree._Element]: Elementos HTML com as tags informadas,
+              na ordem em que são fechados no documento.
+
+        Observação:
+            Os elementos são limpos (`element.clear()`) logo após serem
+            retornados. Extraia os dados necessários (texto, atributos) durante
+            a iteração, sem guardar referências aos elementos.
+
+        Exemplos de uso:
+        ```python
+        for element in RequestHandler.get_elements_streaming(
+            "https://example.com", tags=("a",)
+        ):
+            print(element.get("href"))
+        ```
+        """
+        response = cls.request_with_retry(url, stream=True)
+        parser = etree.HTMLPullParser(
+            events=("end",),
+            tag=tags,
+            encoding=cls._get_declared_encoding(response),
+        )
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                parser.feed(chunk)
+                yield from cls._read_streaming_events(parser)
+            parser.close()
+            yield from cls._read_streaming_events(parser)
+        finally:
+            response.close()
+
+    @staticmethod
+    def _get_declared_encoding(response) -> Optional[str]:
+        """
+        Retorna a codificação declarada no cabeçalho Content-Type da resposta,
+        ou None se o cabeçalho não declarar um charset.
+
+        `response.encoding` não é usado diretamente porque, sem charset, o
+        `requests` assume ISO-8859-1 para qualquer conteúdo "text/*". Com None,
+        o parser detecta a codificação pela tag <meta charset> do HTML.
+        """
+        if "charset=" in response.headers.get("Content-Type", "").lower():
+            return response.encoding
+        return None
+
+    @staticmethod
+    def _read_streaming_events(
+        parser: etree.HTMLPullParser,
+    ) -> Iterator[etree._Element]:
+        """
+        Retorna os elementos já analisados pelo parser incremental, liberando a
+        memória de cada elemento e de seus irmãos anteriores após o uso.
+        """
+        for _, element in parser.read_events():
+            yield element
+            element.clear()
+            # Remove os irmãos anteriores, já processados, para que a árvore
+            # parcial não cresça com o tamanho do documento
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
 
     @classmethod
     def get_soap_from_file(cls, file_path: str) -> BeautifulSoup:
@@ -488,8 +1263,9 @@ class RequestHandler:
         ```
         """
         try:
-            # Abre o arquivo no modo de leitura
-            with open(file_path, "r", encoding="utf-8") as file:
+            # Abre o arquivo no modo de leitura binária; os bytes são
+            # repassados diretamente ao parser lxml
+            with open(file_path, "rb") as file:
                 content = file.read()
 
             # Verifica se o conteúdo do arquivo não está vazio
@@ -499,7 +1275,7 @@ class RequestHandler:
                 )
 
             # Retorna o conteúdo como um objeto BeautifulSoup
-            return BeautifulSoup(content, "html.parser")
+            return BeautifulSoup(content, "lxml", from_encoding="utf-8")
         except FileNotFoundError as err:
             raise FileNotFoundError(
                 f"Arquivo não encontrado: {file_path}. Erro: {err}"
@@ -510,15 +1286,21 @@ class RequestHandler:
 
     @classmethod
     def check_internet_access(
-        cls, url="https://www.google.com", timeout=TIMEOUT_CONNECT
+        cls, url: Optional[str] = None, timeout=TIMEOUT_CONNECT
     ) -> bool:
         """
-        Verifica a disponibilidade de acesso à internet tentando acessar uma
-        URL padrão.
+        Verifica a disponibilidade de acesso à internet.
+
+        Por padrão, abre uma conexão TCP com `INTERNET_CHECK_ADDRESS`, o que
+        exige um único round-trip, sem TLS nem HTTP. Se `url` for informada, a
+        verificação é feita com uma requisição HEAD a essa URL, sem baixar o
+        conteúdo da página, por uma sessão sem cache compartilhada entre as
+        chamadas.
 
         Parâmetros:
-            - url (str): A URL a ser acessada para verificar a conexão. Padrão:
-                "https://www.google.com".
+            - url (Optional[str]): A URL a ser acessada para verificar a
+                conexão. Padrão: None (conexão TCP com
+                `INTERNET_CHECK_ADDRESS`).
             - timeout (int): Tempo máximo de espera (em segundos) para a
                 resposta. Padrão: TIMEOUT_CONNECT.
 
@@ -537,12 +1319,27 @@ class RequestHandler:
             print("Internet disponível!")
         ```
         """
+        logger.debug("Verificando conexão de internet ...")
+        if url is None:
+            try:
+                # Apenas abre e fecha uma conexão TCP com o endereço padrão
+                socket.create_connection(
+                    INTERNET_CHECK_ADDRESS, timeout=timeout
+                ).close()
+            except OSError as err:
+                logger.warning("Internet indisponível! Erro: %s", err)
+                raise RequestsConnectionError(err) from err
+            logger.debug("Conexão OK!")
+            return True
+
         try:
-            logger.debug("Verificando conexão de internet ...")
-            # Faz uma requisição GET ao URL especificado com um tempo limite
-            response = requests.get(url, timeout=timeout)
-            # Verifica se o código de status HTTP é 200 (OK)
-            if response.status_code == 200:
+            # Faz uma requisição HEAD (sem corpo) ao URL especificado com um
+            # tempo limite, reutilizando a conexão das verificações anteriores
+            response = _probe_session.head(
+                url, timeout=timeout, allow_redirects=False
+            )
+            # Verifica se o servidor respondeu com sucesso ou redirecionamento
+            if response.status_code < 400:
                 logger.debug("Conexão OK!")
                 return True
 
@@ -592,15 +1389,8 @@ class RequestHandler:
             return
 
         # Obter o backend do cache
-        cache_backend = session.cache
-        cache_keys = list(cache_backend.responses.keys())
-        cache_size = len(cache_keys)  # Conta as URLs no cache
-
-        # Calcular o tamanho total do cache
-        total_cache_size = sum(
-            len(response.content)
-            for response in cache_backend.responses.values()
-        )
+        responses = session.cache.responses
+        cache_size, total_cache_size = cls._get_cache_totals(responses)
 
         logger.info(
             "REQUEST CACHE: Número de requisições armazenadas: %s; "
@@ -611,14 +1401,55 @@ class RequestHandler:
 
         if show_urls:
             logger.info("\nREQUEST CACHE: URLs armazenadas no cache:")
-            for url_hash in cache_keys:
-                response = cache_backend.responses[url_hash]
-                url = response.request.url
-                expiration = response.expires
+            for url_hash, response_size in cls._iter_cache_sizes(responses):
+                response = responses[url_hash]
                 logger.info(
                     "REQUEST CACHE: - URL: %s; Data de Expiração: %s; "
                     "Tamanho da Resposta: %s MB",
-                    url,
-                    expiration,
-                    round(len(response.content) / (1024**2), 4),
+                    response.request.url,
+                    response.expires,
+                    round(response_size / (1024**2), 4),
                 )
+
+    @staticmethod
+    def _get_cache_totals(responses) -> Tuple[int, int]:
+        """
+        Retorna o número de respostas armazenadas no cache e o tamanho total,
+        em bytes, dessas respostas.
+
+        Para o backend SQLite, os totais são calculados por uma única consulta
+        agregada, sem desserializar as respostas armazenadas.
+        """
+        if isinstance(responses, SQLiteDict):
+            with responses.connection() as connection:
+                count, total_size = connection.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0) "
+                    f"FROM {responses.table_name}"
+                ).fetchone()
+            return count, total_size
+
+        # Nos demais backends, percorre as respostas uma única vez
+        count = 0
+        total_size = 0
+        for response in responses.values():
+            count += 1
+            total_size += len(response.content)
+        return count, total_size
+
+    @staticmethod
+    def _iter_cache_sizes(responses) -> Iterator[Tuple[str, int]]:
+        """
+        Retorna a chave e o tamanho, em bytes, de cada resposta armazenada no
+        cache. Para o backend SQLite, o tamanho é obtido do próprio banco, sem
+        desserializar as respostas.
+        """
+        if isinstance(responses, SQLiteDict):
+            with responses.connection() as connection:
+                rows = connection.execute(
+                    f"SELECT key, LENGTH(value) FROM {responses.table_name}"
+                ).fetchall()
+            yield from rows
+            return
+
+        for url_hash, response in responses.items():
+            yield url_hash, len(response.content)
@@ -1,11 +1,33 @@
 import functools
 import inspect
 import logging
-from abc import ABC, abstractmethod  # pylint: disable=no-name-in-module
-from typing import Callable, Optional, Tuple
+import os
+import sys
+from abc import ABC  # pylint: disable=no-name-in-module
+from collections import deque
+from itertools import chain
+from types import CodeType, FrameType
+from typing import Callable, ClassVar, Deque, Dict, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Com a variável de ambiente OMNIUTILS_STACK_LOG=0, `stack_log` retorna as
+# funções sem decoração, eliminando todo o custo do rastreamento
+STACK_LOG_ENABLED = os.environ.get("OMNIUTILS_STACK_LOG", "1") != "0"
+
+# Pacote e nome de exibição ("módulo.função") já resolvidos para cada objeto de
+# código encontrado na pilha. Um objeto de código pertence sempre ao mesmo
+# módulo e função, então a resolução é feita uma única vez por função; a cada
+# chamada resta apenas formatar o número da linha.
+_CODE_META_CACHE: Dict[CodeType, Tuple[Optional[str], Optional[str]]] = {}
+# Limite de entradas do cache acima do qual ele é esvaziado
+CODE_META_CACHE_MAX_SIZE = 4096
+
+# Valores de `extra` dos registros de log, reaproveitados entre as chamadas (o
+# logging apenas copia as chaves para o registro, sem alterar o dicionário)
+_EXTRA_V1 = {"verbose": 1}
+_EXTRA_V2 = {"verbose": 2}
+
 
 class StackLoggerAbstract(ABC):
     """
@@ -16,16 +38,34 @@ class StackLoggerAbstract(ABC):
     envolver uma função, registra detalhes da execução (argumentos, retorno e
     a hierarquia de chamadas) filtrados de acordo com o framework em uso.
 
-    Para utilizar esta classe, é necessário implementar o método abstrato
-    `get_framework_name` que deve retornar o nome do framework (ou pacote
-    principal) a ser considerado na filtragem da pilha de chamadas.
+    Para utilizar esta classe, defina na subclasse o atributo `FRAMEWORK_NAME`
+    com o nome do framework (ou pacote principal) a ser considerado na
+    filtragem da pilha de chamadas, ou sobrescreva o método
+    `get_framework_name`, se o nome precisar ser calculado.
+
+    Atributos:
+        - FRAMEWORK_NAME (str): Nome do framework. Padrão: "" (sem framework;
+            `stack_log` retorna a função sem decoração).
+        - STRICT_CONTIGUOUS (bool): Se True (padrão), a varredura da pilha é
+            interrompida no primeiro frame fora do framework após os frames do
+            framework, que costumam ser contíguos. Defina como False na
+            subclasse para percorrer a pilha inteira.
+        - BATCH_RECORDS (bool): Se True, quando as duas seções estão
+            habilitadas, a hierarquia de chamadas e os argumentos são
+            registrados em um único registro (com `verbose` 2), reduzindo pela
+            metade o custo de logging antes da chamada. Use apenas se os
+            handlers não tratarem os níveis de `verbose` de forma diferente.
+            Padrão: False.
     """
 
-    @abstractmethod
+    FRAMEWORK_NAME: ClassVar[str] = ""
+    STRICT_CONTIGUOUS = True
+    BATCH_RECORDS = False
+
     def get_framework_name(self) -> str:
         """
         Retorna o nome do framework a ser utilizado para filtrar os frames da
-        pilha.
+        pilha. Por padrão, o valor de `FRAMEWORK_NAME`.
 
         Retorna:
             - str: Nome do framework, por exemplo, "medication_framework".
@@ -33,21 +73,25 @@ class StackLoggerAbstract(ABC):
         Exemplos de uso:
         ```python
         class MyStackLogger(StackLoggerAbstract):
+            FRAMEWORK_NAME = "medication_framework"
+
+        class MyDynamicStackLogger(StackLoggerAbstract):
             def get_framework_name(self) -> str:
-                return "medication_framework"
+                return os.environ["FRAMEWORK_NAME"]
         ```
         """
+        return self.FRAMEWORK_NAME
 
     @staticmethod
     def get_module_name(
-        frame_info: inspect.FrameInfo,
+        frame_info: Union[inspect.FrameInfo, FrameType],
     ) -> Tuple[Optional[str], Optional[str]]:
         """
         Obtém o nome do pacote e do módulo a partir das informações de um frame.
 
         Parâmetros:
-            - frame_info (inspect.FrameInfo): Informações de um frame da pilha
-                de chamadas.
+            - frame_info (Union[inspect.FrameInfo, FrameType]): Informações de
+                um frame da pilha de chamadas, ou o próprio frame.
 
         Retorna:
             - tuple: Uma tupla contendo o nome do pacote e o nome do módulo,
@@ -61,24 +105,49 @@ class StackLoggerAbstract(ABC):
         print(package, module)
         ```
         """
-        package_name = None
-        module_name = None
-        module = inspect.getmodule(frame_info[0])
-        if module:
-            module_name_parts = module.__name__.split(".")
-            package_name = module_name_parts[0]
-            module_name = module_name_parts[-1]
-        return package_name, module_name
+        frame = getattr(frame_info, "frame", frame_info)
+        # O nome do módulo está nas variáveis globais do próprio frame, sem a
+        # busca em `sys.modules` e no sistema de arquivos de
+        # `inspect.getmodule`
+        full_module_name = frame.f_globals.get("__name__")
+        if not full_module_name:
+            return None, None
+        return (
+            full_module_name.split(".", 1)[0],
+            full_module_name.rsplit(".", 1)[-1],
+        )
+
+    def _get_code_meta(
+        self, frame: FrameType
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Retorna o nome do pacote do frame e o seu nome de exibição
+        ("módulo.função"), ou None se o módulo não puder ser identificado,
+        memorizados por objeto de código em `_CODE_META_CACHE`.
+        """
+        code = frame.f_code
+        cached = _CODE_META_CACHE.get(code)
+        if cached is None:
+            if len(_CODE_META_CACHE) >= CODE_META_CACHE_MAX_SIZE:
+                _CODE_META_CACHE.clear()
+            package_name, module_name = self.get_module_name(frame)
+            suffix = None
+            if module_name and code.co_name:
+                suffix = f"{module_name}.{code.co_name}"
+            cached = _CODE_META_CACHE[code] = (package_name, suffix)
+        return cached
 
     @staticmethod
-    def get_class_name(frame_info: inspect.FrameInfo) -> Optional[str]:
+    def get_class_name(
+        frame_info: Union[inspect.FrameInfo, FrameType],
+    ) -> Optional[str]:
         """
         Obtém o nome da classe a partir das informações de um frame, caso
         exista.
 
         Parâmetros:
-            - frame_info (inspect.FrameInfo): Informações de um frame da pilha
-            de chamadas.
+            - frame_info (Union[inspect.FrameInfo, FrameType]): Informações de
+            um frame da pilha de chamadas, ou o próprio frame.
 
         Retorna:
             - Optional[str]: O nome da classe se presente; caso contrário, None.
@@ -91,7 +160,13 @@ class StackLoggerAbstract(ABC):
         print(class_name)
         ```
         """
-        instance = frame_info.frame.f_locals.get("self", None)
+        frame = getattr(frame_info, "frame", frame_info)
+        # Só acessa `f_locals` (que monta um dicionário com as variáveis
+        # locais) se o primeiro argumento da função se chamar `self`
+        code = frame.f_code
+        if not (code.co_argcount and code.co_varnames[0] == "self"):
+            return None
+        instance = frame.f_locals.get("self", None)
         if instance:
             return instance.__class__.__name__
         return None
@@ -112,13 +187,16 @@ class StackLoggerAbstract(ABC):
 
         Retorna:
             - Callable: A função decorada que, ao ser chamada, registra as
-                informações da pilha de chamadas e seu comportamento.
+                informações da pilha de chamadas e seu comportamento. Se
+                `get_framework_name` retornar um nome vazio (ou None), ou se
+                a variável de ambiente `OMNIUTILS_STACK_LOG` for "0" na
+                importação deste módulo, a própria função `func`, sem
+                decoração.
 
         Exemplos de uso:
         ```python
         class MyStackLogger(StackLoggerAbstract):
-            def get_framework_name(self) -> str:
-                return "medication_framework"
+            FRAMEWORK_NAME = "medication_framework"
 
         logger_instance = MyStackLogger()
 
@@ -131,37 +209,116 @@ class StackLoggerAbstract(ABC):
         ```
         """
 
+        if not STACK_LOG_ENABLED:
+            return func
+
+        # O framework é definido uma única vez, na decoração. Sem framework,
+        # não há frames a filtrar e a função é retornada sem decoração.
+        framework_name = self.FRAMEWORK_NAME or self.get_framework_name()
+        if not framework_name:
+            return func
+
+        # A localização da função decorada não muda entre as chamadas, então
+        # é calculada uma única vez, na decoração
+        # Linha da definição (ou do primeiro decorador) lida diretamente do
+        # objeto de código, sem abrir o arquivo-fonte
+        code = getattr(func, "__code__", None)
+        lineno_func = code.co_firstlineno if code is not None else 0
+        module_name_func = func.__module__.rsplit(".", 1)[-1]
+        name_func = f"[{lineno_func}]{module_name_func}.{func.__name__}"
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            framework_name = self.get_framework_name()
-            names = []
-            stack = inspect.stack()
-
-            for frame_info in stack:
-                lineno = frame_info.lineno
-                package_name, module_name = self.get_module_name(frame_info)
-                function_name = frame_info.function
-                # Ignora o próprio wrapper para evitar recursividade na
-                # impressão
-                if module_name and function_name and function_name != "wrapper":
-                    name = f"[{lineno}]{module_name}.{function_name}"
-                    if package_name == framework_name:
-                        names.append(name)
-
-            lineno_func = inspect.getsourcelines(func)[1]
-            module_name_func = func.__module__.split(".")[-1]
-            name_func = f"[{lineno_func}]{module_name_func}.{func.__name__}"
-            names.insert(0, name_func)
-            names.reverse()
-
-            logger.debug("%s", " > ".join(names), extra={"verbose": 1})
-            logger.debug(
-                "args: %s, kwargs: %s", args, kwargs, extra={"verbose": 2}
-            )
+            log_hierarchy = self._verbose1_enabled()
+            log_details = self._verbose2_enabled()
+            # Sem nenhuma seção habilitada, ou sem handlers que recebam os
+            # registros (que seriam descartados), nada é calculado
+            if not (log_hierarchy or log_details) or not logger.hasHandlers():
+                return func(*args, **kwargs)
+
+            if log_hierarchy:
+                frames = self._collect_framework_frames(
+                    sys._getframe(1),  # pylint: disable=protected-access
+                    framework_name,
+                )
+                # Do frame mais externo até a função decorada, formatando os
+                # nomes diretamente no join, sem uma lista intermediária
+                hierarchy = " > ".join(
+                    chain(
+                        (f"[{lineno}]{suffix}" for lineno, suffix in frames),
+                        (name_func,),
+                    )
+                )
+                if log_details and self.BATCH_RECORDS:
+                    logger.debug(
+                        "%s\nargs: %s, kwargs: %s",
+                        hierarchy,
+                        args,
+                        kwargs,
+                        extra=_EXTRA_V2,
+                    )
+                else:
+                    logger.debug("%s", hierarchy, extra=_EXTRA_V1)
+
+            if log_details and not (log_hierarchy and self.BATCH_RECORDS):
+                # Os objetos são passados como argumentos do logging, e não
+                # formatados aqui: `str`/`repr` só é chamado se o registro for
+                # de fato emitido (após os filtros por `verbose`)
+                logger.debug(
+                    "args: %s, kwargs: %s", args, kwargs, extra=_EXTRA_V2
+                )
 
             result = func(*args, **kwargs)
 
-            logger.debug("retorno: %s", result, extra={"verbose": 2})
+            if log_details:
+                logger.debug("retorno: %s", result, extra=_EXTRA_V2)
             return result
 
         return wrapper
+
+    def _collect_framework_frames(
+        self, frame: Optional[FrameType], framework_name: str
+    ) -> Deque[Tuple[int, str]]:
+        """
+        Percorre a pilha a partir de `frame`, seguindo `f_back`, e retorna a
+        linha e o nome de exibição ("módulo.função") dos frames do framework,
+        do mais externo para o mais interno.
+
+        A pilha é percorrida frame a frame, em vez de usar `inspect.stack()`,
+        que monta um FrameInfo (e lê o arquivo-fonte) para cada frame.
+        """
+        # A pilha é percorrida do frame mais interno para o mais externo;
+        # `appendleft` já deixa os frames na ordem de exibição
+        frames: Deque[Tuple[int, str]] = deque()
+        seen_framework = False
+        while frame is not None:
+            # Ignora o próprio wrapper para evitar recursividade na impressão
+            if frame.f_code.co_name == "wrapper":
+                frame = frame.f_back
+                continue
+            package_name, suffix = self._get_code_meta(frame)
+            if suffix is not None:
+                if package_name == framework_name:
+                    frames.appendleft((frame.f_lineno, suffix))
+                    seen_framework = True
+                elif seen_framework and self.STRICT_CONTIGUOUS:
+                    # Já saímos da região do framework na pilha
+                    break
+            frame = frame.f_back
+        return frames
+
+    def _verbose1_enabled(self) -> bool:
+        """
+        Indica se a hierarquia de chamadas (registro com `verbose` 1) deve ser
+        registrada. Por padrão, apenas se o logger estiver habilitado para
+        DEBUG; subclasses podem sobrescrever para desativar esta seção.
+        """
+        return logger.isEnabledFor(logging.DEBUG)
+
+    def _verbose2_enabled(self) -> bool:
+        """
+        Indica se os argumentos e o retorno (registros com `verbose` 2) devem
+        ser registrados. Por padrão, apenas se o logger estiver habilitado
+        para DEBUG; subclasses podem sobrescrever para desativar esta seção.
+        """
+        return logger.isEnabledFor(logging.DEBUG)
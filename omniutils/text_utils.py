@@ -1,17 +1,332 @@
+import functools
 import logging
+import operator
 import re
 import unicodedata
-from codecs import decode  # pylint: disable=no-name-in-module
+from codecs import unicode_escape_decode  # pylint: disable=no-name-in-module
 from datetime import datetime
-from typing import List, Optional, Union
+from itertools import takewhile
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
-STOPWORDS = ["do", "de", "da"]
+STOPWORDS = ("do", "de", "da")
+
+# Padrões fixos compilados uma única vez, na importação do módulo, evitando a
+# busca no cache interno do `re` (e a análise do padrão) a cada chamada
+_NORMALIZE_STR_RE = re.compile(r"[^A-Za-z0-9_]+")
+_NUMERIC_SUFFIX_RE = re.compile(r"[0-9¹²³]$")
+# Padrão linear: espaços nas extremidades ficam no grupo e são removidos com
+# `strip()`. Retirá-los no próprio regex (`\s*[^)]*[^)\s]\s*`) sobrepõe os
+# quantificadores e torna a busca quadrática em um "(" sem fechamento
+# seguido de muitos espaços
+_PAREN_RE = re.compile(r"\((?P<conteudo>[^)]+)\)")
+_LAST_X_RE = re.compile(r"X\s*(?P<number>\d+(?:[\.,]\d+)?)", re.IGNORECASE)
+_GENERIC_NUMBER_RE = re.compile(r"(?P<number>\d+(?:[.,]\d+)*)")
+_UNICODE_ESCAPE_RE = re.compile(r"\\u[0-9a-fA-F]{4}")
+_COMMA_NUMBER_RE = re.compile(r"(\d+),(\d+)")
+_DOT_NUMBER_RE = re.compile(r"(\d)\.(\d)")
+_SPECIAL_CHARS_RE = re.compile(r"[^\w\sÀ-ÿ]")
+_URL_RE = re.compile(r"https?://[^\s]+")
+_DATE_RE = re.compile(r"\b\d{2}/\d{2}/\d{4}\b")
+_DIGIT_RE = re.compile(r"\d")
+
+# Separador usado para processar lotes de textos com uma única execução de um
+# regex: não é dígito nem pontuação, então nenhuma correspondência o atravessa
+_BATCH_SEPARATOR = "\x00"
+
+# Predicado `item != ""` executado inteiramente em C (sem uma lambda),
+# válido também para itens que não são strings
+_IS_NOT_EMPTY = functools.partial(operator.ne, "")
+
+# Únicos textos sem dígitos aceitos por `float` (ignorando sinal, espaços e
+# maiúsculas/minúsculas)
+_FLOAT_WORDS = frozenset({"inf", "infinity", "nan"})
+
+# Tabelas para `str.translate` com o resultado da normalização de cada
+# caractere Latin-1 não ASCII: a decomposição NFKD (usada por `normalize_str`)
+# e a decomposição NFD sem as marcas combinantes (usada por `normalize_text`).
+# Para textos sem caracteres fora do Latin-1, equivalem à normalização
+# completa, sem consultar o `unicodedata` a cada chamada
+_LATIN1_NFKD_TABLE = {
+    code: unicodedata.normalize("NFKD", chr(code))
+    for code in range(0x80, 0x100)
+    if unicodedata.normalize("NFKD", chr(code)) != chr(code)
+}
+_LATIN1_ACCENT_TABLE = {
+    code: "".join(
+        c
+        for c in unicodedata.normalize("NFD", chr(code))
+        if unicodedata.category(c) != "Mn"
+    )
+    for code in range(0x80, 0x100)
+    if unicodedata.normalize("NFD", chr(code)) != chr(code)
+}
+# Qualquer caractere fora do Latin-1, que exige a normalização completa
+_NON_LATIN1_RE = re.compile(r"[^\x00-\xff]")
+
+# Caracteres considerados ilegais por `remove_illegal_characters`: os
+# caracteres de controle ASCII de 0 a 31 (null, tabulações, nova linha,
+# retorno de carro, escape, separadores etc.)
+ILLEGAL_CHARACTERS = tuple(map(chr, range(32)))
+# Tabela para `str.translate` que remove os caracteres ilegais
+_ILLEGAL_CTRL_TABLE = dict.fromkeys(map(ord, ILLEGAL_CHARACTERS))
+# Remoção dos caracteres de controle e dos acentos Latin-1 na mesma passagem
+_SANITIZE_LATIN1_TABLE = {**_ILLEGAL_CTRL_TABLE, **_LATIN1_ACCENT_TABLE}
+
+# Tabela para `str.translate` que remove os caracteres ASCII eliminados por
+# `_SPECIAL_CHARS_RE` (tudo exceto letras, dígitos, "_" e espaços)
+_SPECIAL_ASCII_TABLE = dict.fromkeys(
+    code for code in range(0x80) if _SPECIAL_CHARS_RE.match(chr(code))
+)
+
+# Tabela para `str.translate` que converte um número no formato brasileiro
+# para o formato aceito por `float`: remove os pontos (separador de milhar) e
+# troca as vírgulas (separador decimal) por pontos
+_NUMBER_SEP_TABLE = str.maketrans({".": "", ",": "."})
+# O mesmo, para os separadores entre dígitos de um texto qualquer
+_DECIMAL_SEPARATOR_RE = re.compile(r"(?<=\d)[.,](?=\d)")
+_DECIMAL_SEPARATOR_REPLACEMENTS = {".": "", ",": "."}
+# Trechos em que as substituições de `remove_dot_between_numbers` e
+# `replace_comma_with_dot` não tratam todos os separadores, por não se
+# sobreporem: um dígito isolado entre dois pontos ("1.2.3") ou um número entre
+# duas vírgulas ("1,2,3")
+_OVERLAPPING_SEPARATORS_RE = re.compile(r"\d\.\d\.\d|\d,[\d.]+,\d")
+
+# Limite de padrões montados a partir de palavras-chave/stopwords mantidos em
+# cache pelos compiladores abaixo
+KEYWORD_RE_CACHE_SIZE = 256
+# Limite de tabelas de `normalize_str` (uma por `space_char`) mantidas em cache
+NORMALIZE_STR_TABLE_CACHE_SIZE = 32
+# Limite de resultados de `normalize_str` e `normalize_text` mantidos em cache
+# (valores repetidos, como categorias e unidades, são normalizados uma vez)
+NORMALIZE_CACHE_SIZE = 4096
+# Limite de resultados de `to_number_str` e `ensure_utf8` mantidos em cache
+# (o mesmo valor, como "3.0", costuma se repetir em milhares de registros)
+CONVERSION_CACHE_SIZE = 8192
+
+
+# Os padrões que dependem de listas de palavras-chave ou stopwords são
+# compilados uma única vez por combinação de argumentos (as listas são
+# convertidas em tuplas, para que possam servir de chave do cache)
+@functools.lru_cache(maxsize=KEYWORD_RE_CACHE_SIZE)
+def _compile_keyword_number_re(keywords: Tuple[str, ...]) -> re.Pattern:
+    """
+    Números seguidos de uma das palavras-chave, capturando os dois (grupos
+    `number` e `keyword`) na mesma busca.
+    """
+    # As palavras mais longas vêm primeiro na alternância, para que "mg/ml"
+    # não seja capturada apenas como "mg"
+    keywords_pattern = "|".join(
+        map(re.escape, sorted(keywords, key=len, reverse=True))
+    )
+    return re.compile(
+        rf"(?P<number>\d+(?:,\d+)?)\s*\b(?P<keyword>{keywords_pattern})\b",
+        re.IGNORECASE,
+    )
+
+
+@functools.lru_cache(maxsize=KEYWORD_RE_CACHE_SIZE)
+def _compile_parentheses_after_keyword_re(
+    keyword: str, stopwords: Tuple[str, ...]
+) -> re.Pattern:
+    """Conteúdo entre parênteses (ou restante do texto) após a palavra-chave."""
+    stopwords_pattern = "|".join(map(re.escape, stopwords))
+    return re.compile(
+        rf"{re.escape(keyword)}\s*(?::\s*)?(?:{stopwords_pattern})*\s*(?:\((?P<conteudo1>[^)]+)\)|(?P<conteudo2>\S+.*))",  # pylint: disable=line-too-long  # noqa: E501
+        re.IGNORECASE,
+    )
+
+
+@functools.lru_cache(maxsize=KEYWORD_RE_CACHE_SIZE)
+def _compile_after_keyword_re(
+    keyword: str, stopwords: Tuple[str, ...]
+) -> re.Pattern:
+    """Conteúdo após a palavra-chave, ignorando as stopwords."""
+    stopwords_pattern = "|".join(map(re.escape, stopwords))
+    return re.compile(
+        rf"{re.escape(keyword)}\s*(?::\s*)?(?:{stopwords_pattern})*\s*(?P<conteudo>\S+.*)",  # pylint: disable=line-too-long  # noqa: E501
+        re.IGNORECASE,
+    )
+
+
+@functools.lru_cache(maxsize=KEYWORD_RE_CACHE_SIZE)
+def _compile_number_after_keyword_re(keyword: str) -> re.Pattern:
+    """Primeiro número após a palavra-chave."""
+    return re.compile(
+        rf"{re.escape(keyword)}.*?(?P<number>\d+(?:[.,]\d+)*)", re.IGNORECASE
+    )
+
+
+@functools.lru_cache(maxsize=KEYWORD_RE_CACHE_SIZE)
+def _compile_keywords_and_dates_re(keywords: Tuple[str, ...]) -> re.Pattern:
+    """
+    Palavras-chave ou datas no formato dd/mm/yyyy. Sem grupos de captura, o
+    `findall` retorna diretamente o texto de cada ocorrência.
+    """
+    keywords_pattern = "|".join(map(re.escape, keywords))
+    return re.compile(
+        rf"\b(?:{keywords_pattern})\b|\d{{2}}/\d{{2}}/\d{{4}}", re.IGNORECASE
+    )
+
+
+@functools.lru_cache(maxsize=KEYWORD_RE_CACHE_SIZE)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Padrão informado pelo chamador, compilado uma única vez."""
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=NORMALIZE_STR_TABLE_CACHE_SIZE)
+def _normalize_str_table(space_char: str) -> Dict[int, str]:
+    """
+    Tabela para `str.translate` com o resultado de `normalize_str` (sem
+    `special_char`) para cada caractere Latin-1: minúsculo, decomposto (NFKD)
+    e restrito a letras, números e underscores. O espaço é mapeado para o
+    `space_char` informado, tratado da mesma forma.
+    """
+    table = {
+        code: _NORMALIZE_STR_RE.sub(
+            "", unicodedata.normalize("NFKD", chr(code).lower())
+        )
+        for code in range(0x100)
+    }
+    table[ord(" ")] = _NORMALIZE_STR_RE.sub("", space_char.lower())
+    return table
+
+
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_text(text: str) -> str:
+    """Implementação de `TextUtils.normalize_text` para strings."""
+    if text.isascii():
+        return text.lower().strip()
+    if not _NON_LATIN1_RE.search(text):
+        return text.translate(_LATIN1_ACCENT_TABLE).lower().strip()
+    # Fora do Latin-1, remove as marcas não espaçadoras (categoria "Mn") da
+    # forma decomposta. A categoria é consultada caractere a caractere: não
+    # há um intervalo fixo de code points equivalente a ela (há marcas "Mn"
+    # em hebraico, árabe e outras escritas)
+    return (
+        "".join(
+            c
+            for c in unicodedata.normalize("NFD", text)
+            if unicodedata.category(c) != "Mn"
+        )
+        .lower()
+        .strip()
+    )
+
+
+@functools.lru_cache(maxsize=CONVERSION_CACHE_SIZE, typed=True)
+def _float_to_number_str(value: Union[float, str]) -> str:
+    """
+    Conversão de `TextUtils.to_number_str` via `float`. Valores que não podem
+    ser convertidos levantam a exceção de `float`, que não fica em cache.
+    """
+    float_value = float(value)
+    if float_value.is_integer():
+        # Remover zeros desnecessários convertendo para int se possível.
+        # `str(int(...))` é mais rápido que `format(float_value, ".0f")` e,
+        # ao contrário dele, converte -0.0 em "0" (e não "-0")
+        return str(int(float_value))
+    # Não é inteiro, retorna float.
+    return str(float_value)
+
+
+@functools.lru_cache(maxsize=CONVERSION_CACHE_SIZE)
+def _decode_unicode_escapes(text: str) -> str:
+    """Implementação de `TextUtils.ensure_utf8` para textos com "\\u"."""
+    # Só decodifica textos com ao menos um escape válido (\uXXXX): um "\u"
+    # literal, como em "C:\users", perderia as barras invertidas e teria os
+    # caracteres não ASCII corrompidos pela decodificação
+    if not _UNICODE_ESCAPE_RE.search(text):
+        return text
+    # Se a decodificação falhar (outra sequência inválida no mesmo texto), o
+    # texto é mantido. Chama o decodificador do codec diretamente, sem a
+    # busca no registro de codecs feita por `codecs.decode`
+    try:
+        return unicode_escape_decode(text)[0]
+    except UnicodeDecodeError:
+        return text
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    """
+    Monta, recursivamente, a alternância das palavras fatorada pelos
+    prefixos comuns (uma trie), mantendo a prioridade da ordem da lista.
+
+    As palavras são agrupadas pelo primeiro caractere, já que palavras com
+    primeiros caracteres diferentes nunca correspondem na mesma posição. Uma
+    palavra que termina no nó (sufixo vazio) vira uma alternativa vazia na
+    sua posição da lista, e apenas as palavras entre duas delas são
+    agrupadas, para que nenhuma seja tentada antes de outra listada antes.
+    """
+    branches: List[str] = []
+    groups: Dict[str, Tuple[str, List[str]]] = {}
+
+    def flush_groups() -> None:
+        for char, suffixes in groups.values():
+            branches.append(re.escape(char) + _trie_regex(suffixes))
+        groups.clear()
+
+    for word in words:
+        if word:
+            groups.setdefault(word[0].lower(), (word[0], []))[1].append(
+                word[1:]
+            )
+        else:
+            flush_groups()
+            branches.append("")
+    flush_groups()
+
+    if len(branches) == 1:
+        return branches[0]
+    return f"(?:{'|'.join(branches)})"
+
+
+@functools.lru_cache(maxsize=KEYWORD_RE_CACHE_SIZE)
+def _compile_word_trie_re(words: Tuple[str, ...]) -> re.Pattern:
+    """
+    Qualquer uma das palavras, como palavra inteira, com a alternância
+    fatorada pelos prefixos comuns (uma trie). Em cada posição do texto o
+    regex percorre apenas os ramos da trie compatíveis com o texto, em vez de
+    tentar cada palavra da lista, o que mantém a busca rápida mesmo para
+    listas grandes. Havendo mais de uma palavra possível na mesma posição, a
+    primeira da lista é a escolhida, como na alternância simples.
+    """
+    # Repetições não alteram o resultado (vale a primeira ocorrência)
+    return re.compile(
+        rf"\b({_trie_regex(dict.fromkeys(words))})\b", re.IGNORECASE
+    )
+
+
+def _parse_ddmmyyyy(date: str) -> datetime:
+    """
+    Converte uma data "dd/mm/yyyy" já validada pelo regex padrão de
+    `extract_all_dates_as_datetime`, montando o datetime diretamente a partir
+    das posições fixas, sem o custo de `datetime.strptime`.
+    """
+    return datetime(int(date[6:]), int(date[3:5]), int(date[:2]))
+
+
+def _strptime_ddmmyyyy(date: str) -> datetime:
+    """Converte uma data "dd/mm/yyyy" de formato não garantido."""
+    return datetime.strptime(date, "%d/%m/%Y")
 
 
 class TextUtils:
     @staticmethod
+    @functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
     def normalize_str(
         text: str, special_char: str = "", space_char: str = "_"
     ) -> str:
@@ -29,6 +344,9 @@ class TextUtils:
         Quando nenhum caractere é especificado em `special_char`, os
         caracteres especiais são removidos.
 
+        Os resultados das últimas `NORMALIZE_CACHE_SIZE` combinações de
+        argumentos ficam em cache (veja `clear_normalize_cache`).
+
         Parâmetros:
             text (str): A string a ser normalizada.
             special_char (str): O caractere que substituirá caracteres
@@ -53,16 +371,85 @@ class TextUtils:
             # "arquivo+com+espaco-pdf"
         ```
         """
+        # Sem `special_char`, os caracteres especiais são apenas removidos, e
+        # todas as etapas abaixo se reduzem a uma tabela por caractere:
+        # texto Latin-1 é normalizado em uma única passagem de
+        # `str.translate`
+        if (
+            not special_char
+            and space_char.isascii()
+            and not _NON_LATIN1_RE.search(text)
+        ):
+            return text.translate(_normalize_str_table(space_char))
         # Substituir espaços pelo caractere especificado
         text = text.replace(" ", space_char).lower()
+        # Permitir apenas letras, números e underscores. Texto ASCII não tem
+        # acentos a decompor, então a normalização Unicode é dispensada
+        if text.isascii():
+            return _NORMALIZE_STR_RE.sub(special_char, text)
+        # Texto Latin-1 (o caso comum em português) é decomposto pela tabela
+        # pré-calculada, em uma única passagem de `str.translate`
+        if not _NON_LATIN1_RE.search(text):
+            return _NORMALIZE_STR_RE.sub(
+                special_char, text.translate(_LATIN1_NFKD_TABLE)
+            )
         # Remover acentos e aplicar substituições de caracteres especiais
-        # Permitir apenas letras, números e underscores
-        return re.sub(
-            r"[^A-Za-z0-9_]+",
-            special_char,
-            unicodedata.normalize("NFKD", text),
+        return _NORMALIZE_STR_RE.sub(
+            special_char, unicodedata.normalize("NFKD", text)
         )
 
+    @classmethod
+    def normalize_str_many(
+        cls,
+        texts: Iterable[str],
+        special_char: str = "",
+        space_char: str = "_",
+    ) -> List[str]:
+        """
+        Normaliza uma sequência de strings, com o mesmo resultado de aplicar
+        `normalize_str` a cada uma delas.
+
+        *** Útil para sanitizar muitos registros de uma vez (cargas em banco
+        de dados, lotes de nomes de arquivos). ***
+
+        A escolha do caminho de normalização que depende apenas dos
+        parâmetros (e a tabela de `str.translate` correspondente) é feita uma
+        única vez para o lote; para cada texto Latin-1 resta uma única
+        passagem de `str.translate`.
+
+        Parâmetros:
+            texts (Iterable[str]): As strings a serem normalizadas.
+            special_char (str): O caractere que substituirá caracteres
+                especiais. Caso não seja especificado (ou seja vazio), os
+                caracteres especiais serão removidos.
+            space_char (str): O caractere que substituirá espaços em branco.
+                O padrão é "_".
+
+        Retorna:
+            List[str]: As strings normalizadas, na mesma ordem da entrada.
+
+        Exemplo:
+        ```python
+            TextUtils.normalize_str_many(["São Paulo", "Coração & Saúde!"])
+            # ["sao_paulo", "coracao__saude"]
+        ```
+        """
+        # Método resolvido uma única vez, fora do laço
+        normalize_str = cls.normalize_str
+        if special_char or not space_char.isascii():
+            return [
+                normalize_str(text, special_char, space_char) for text in texts
+            ]
+        table = _normalize_str_table(space_char)
+        return [
+            (
+                normalize_str(text, special_char, space_char)
+                if _NON_LATIN1_RE.search(text)
+                else text.translate(table)
+            )
+            for text in texts
+        ]
+
     @staticmethod
     def normalize_text(text):
         """
@@ -76,6 +463,9 @@ class TextUtils:
         garantindo que diferenças de acentuação, capitalização ou espaços
         não impactem os resultados.
 
+        Os resultados dos últimos `NORMALIZE_CACHE_SIZE` textos ficam em cache
+        (veja `clear_normalize_cache`).
+
         Parâmetros
         ----------
         text : str
@@ -103,17 +493,70 @@ class TextUtils:
         ``´
         """
         if isinstance(text, str):
-            return (
-                "".join(
-                    c
-                    for c in unicodedata.normalize("NFD", text)
-                    if unicodedata.category(c) != "Mn"
-                )
-                .lower()
-                .strip()
-            )
+            return _normalize_text(text)
         return text
 
+    @staticmethod
+    def clear_normalize_cache() -> None:
+        """
+        Esvazia os caches de resultados de `normalize_str` e
+        `normalize_text`.
+        """
+        TextUtils.normalize_str.cache_clear()
+        _normalize_text.cache_clear()
+
+    @staticmethod
+    def clear_conversion_cache() -> None:
+        """
+        Esvazia os caches de resultados de `to_number_str` e `ensure_utf8`.
+        """
+        _float_to_number_str.cache_clear()
+        _decode_unicode_escapes.cache_clear()
+
+    @classmethod
+    def sanitize(cls, text):
+        """
+        Remove os caracteres ilegais e normaliza o texto em uma única etapa,
+        com o mesmo resultado de
+        `normalize_text(remove_illegal_characters(text))`.
+
+        *** Recomendado para processar muitos textos em sequência (cargas de
+        dados, por exemplo), no lugar das duas chamadas encadeadas. ***
+
+        Para textos ASCII ou Latin-1 (o caso comum em português), a remoção
+        dos caracteres de controle e dos acentos é feita por uma única tabela
+        de `str.translate`, percorrendo o texto uma só vez. Demais textos
+        seguem pela normalização Unicode completa de `normalize_text`.
+
+        Parâmetros
+        ----------
+        text : str
+            O texto a ser sanitizado. Caso não seja uma string, será retornado
+            o valor original.
+
+        Retorna
+        -------
+        str
+            O texto sem caracteres de controle (ASCII de 0 a 31), sem acentos,
+            em letras minúsculas e sem espaços nas extremidades. Caso `text`
+            não seja uma string, retorna o valor original sem alterações.
+
+        Exemplos
+        --------
+        ```python
+            TextUtils.sanitize("  Coração\x00 de Mãe\n")
+            # Saída: 'coracao de mae'
+        ```
+        """
+        if not isinstance(text, str):
+            return text
+        if text.isascii():
+            return text.translate(_ILLEGAL_CTRL_TABLE).lower().strip()
+        if not _NON_LATIN1_RE.search(text):
+            return text.translate(_SANITIZE_LATIN1_TABLE).lower().strip()
+        # O texto já é uma string: chama a implementação diretamente
+        return _normalize_text(text.translate(_ILLEGAL_CTRL_TABLE))
+
     @staticmethod
     def tokenize_and_sort(text: str) -> str:
         """
@@ -152,7 +595,12 @@ class TextUtils:
         # Saída: 123
         """
         if isinstance(text, str):
-            return " ".join(sorted(text.lower().strip().split()))
+            # `split()` já descarta os espaços das extremidades; os tokens são
+            # ordenados pela forma minúscula e convertidos um a um, sem criar
+            # uma cópia minúscula do texto inteiro
+            tokens = text.split()
+            tokens.sort(key=str.lower)
+            return " ".join(map(str.lower, tokens))
         return text
 
     @staticmethod
@@ -187,16 +635,16 @@ class TextUtils:
         Detalhes da Implementação:
             - O padrão de regex identifica números no formato "123" ou "123,45"
               seguidos por qualquer palavra-chave definida.
-            - As palavras-chave são definidas como um padrão opcional a ser
-              buscado imediatamente após o número.
+            - As palavras-chave são capturadas imediatamente após o número
+              (espaços entre eles são permitidos).
             - Os resultados são retornados em letras maiúsculas para
               uniformidade.
 
         Fluxo:
             1. Cria um padrão de regex para identificar números seguidos por
                palavras-chave fornecidas.
-            2. Para cada número encontrado, verifica se há uma palavra-chave
-               associada.
+            2. Captura, na mesma busca, cada número e a palavra-chave que o
+               segue.
             3. Retorna uma lista de pares "número palavra-chave".
 
         Notas:
@@ -206,22 +654,15 @@ class TextUtils:
         """
 
         if keywords is None:
-            keywords = ["mg", "mg/ml", "ml", "g"]
-
-        keywords_pattern = "|".join(map(re.escape, keywords))
-        pattern = rf"(\d+(?:,\d+)?)\s*(?=\b(?:{keywords_pattern})\b)"
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        results = []
-        for match in matches:
-            number = match.group(1)
-            keyword_match = re.search(
-                rf"\b(?:{keywords_pattern})\b",
-                text[match.end()],
-                re.IGNORECASE,
+            keywords = ("mg", "mg/ml", "ml", "g")
+
+        # Número e palavra-chave são capturados em uma única varredura
+        return [
+            f"{match.group('number')} {match.group('keyword').upper()}"
+            for match in _compile_keyword_number_re(tuple(keywords)).finditer(
+                text
             )
-            keyword = keyword_match.group(0).upper() if keyword_match else None
-            results.append(f"{number} {keyword}")
-        return results
+        ]
 
     @staticmethod
     def remove_numeric_suffix(text: str) -> str:
@@ -262,9 +703,8 @@ class TextUtils:
             - O regex utiliza `$` para garantir que o número esteja no final da
               string.
         """
-        pattern = r"[0-9¹²³]$"
-        if re.search(pattern, text):
-            return re.sub(pattern, "", text)
+        if _NUMERIC_SUFFIX_RE.search(text):
+            return _NUMERIC_SUFFIX_RE.sub("", text)
         return text
 
     @staticmethod
@@ -344,18 +784,16 @@ class TextUtils:
         """
         if stopwords is None:
             stopwords = STOPWORDS
-        stopwords_pattern = "|".join(map(re.escape, stopwords))
         if keyword:
-            pattern = rf"{re.escape(keyword)}\s*(?::\s*)?(?:{stopwords_pattern})*\s*(?:\((?P<conteudo1>[^)]+)\)|(?P<conteudo2>\S+.*))"  # pylint: disable=line-too-long  # noqa: E501
+            match = _compile_parentheses_after_keyword_re(
+                keyword, tuple(stopwords)
+            ).search(text)
         else:
-            pattern = r"\((?P<conteudo>[^)]+)\)"
-        match = re.search(pattern, text, re.IGNORECASE)
+            match = _PAREN_RE.search(text)
         if match:
-            if keyword:
-                return (
-                    match.group("conteudo1") or match.group("conteudo2")
-                ).strip()
-            return match.group("conteudo").strip()
+            # Apenas um dos grupos participa da correspondência: o último
+            # grupo capturado é o conteúdo
+            return match[match.lastgroup].strip()
         raise ValueError(f"Padrão não encontrado na string: '{text}'")
 
     @staticmethod
@@ -418,21 +856,20 @@ class TextUtils:
         if stopwords is None:
             stopwords = STOPWORDS
 
-        stopwords_pattern = "|".join(map(re.escape, stopwords))
-
-        # Constrói a regex para capturar o conteúdo após a palavra-chave,
-        # ignorando caracteres e stopwords especificadas
-        pattern = rf"{re.escape(keyword)}\s*(?::\s*)?(?:{stopwords_pattern})\
-        *\s*(?P<conteudo>\S+.*)"
-
-        # Usa regex para encontrar o padrão, ignorando maiúsculas/minúsculas
-        match = re.search(pattern, text, re.IGNORECASE)
+        # Regex (em cache) para capturar o conteúdo após a palavra-chave,
+        # ignorando caracteres e stopwords especificadas e
+        # maiúsculas/minúsculas
+        match = _compile_after_keyword_re(keyword, tuple(stopwords)).search(
+            text
+        )
 
         # Verifica se houve correspondência
         if match:
             content = match.group("conteudo").strip()
             if special_chars_pattern:
-                content = re.sub(special_chars_pattern, "", content)
+                content = _compile_pattern(special_chars_pattern).sub(
+                    "", content
+                )
             return content
         return ""
 
@@ -508,18 +945,14 @@ class TextUtils:
         """
         if keyword:
             # Regex para capturar número após palavra-chave
-            pattern = rf"{re.escape(keyword)}.*?(?P<number>\d+(?:[.,]\d+)*)"
+            match = _compile_number_after_keyword_re(keyword).search(text)
         else:
-            # Regex genérico para capturar o primeiro número, incluindo ponto
-            # final opcional
-            pattern = r"(?P<number>\d+(?:[.,]\d+)*)"  # Modified regex
+            # Regex genérico (pré-compilado) para capturar o primeiro número
+            match = _GENERIC_NUMBER_RE.search(text)
 
-        match = re.search(pattern, text, re.IGNORECASE)
         if match:
             # Trata separadores decimais e de milhar
-            number_str = (
-                match.group("number").replace(".", "").replace(",", ".")
-            )
+            number_str = match.group("number").translate(_NUMBER_SEP_TABLE)
             try:
                 return float(number_str)
             except ValueError as err:
@@ -575,21 +1008,16 @@ class TextUtils:
         - O método pode ser usado para processar strings onde informações
           numéricas seguem uma notação com "X".
         """
-        # Padrão para capturar a letra "X" seguida de um número
-        pattern = r"X\s*(?P<number>\d+(?:[\.,]\d+)?)"
-
-        # Encontra todas as correspondências no texto
-        matches = list(re.finditer(pattern, text, re.IGNORECASE))
-
-        if matches:
-            # Seleciona a última correspondência
-            match = matches[-1]
-            number_str = (
-                match.group("number").replace(".", "").replace(",", ".")
-            )
-            return float(number_str)
+        # Percorre as correspondências guardando apenas a última, sem montar a
+        # lista com todas elas (uma única varredura do texto)
+        last = None
+        for last in _LAST_X_RE.finditer(text):
+            pass
+        if last is None:
+            raise ValueError(f"Padrão não encontrado na string: '{text}'")
 
-        raise ValueError(f"Padrão não encontrado na string: '{text}'")
+        number_str = last.group("number").translate(_NUMBER_SEP_TABLE)
+        return float(number_str)
 
     @staticmethod
     def extract_keywords_and_dates(
@@ -641,23 +1069,12 @@ class TextUtils:
           como URLs, palavras específicas e datas relevantes.
         """
         if not keywords:
-            keywords = ["acesso", "disponível", "http", "https", "www"]
+            keywords = ("acesso", "disponível", "http", "https", "www")
 
-        # Criação do padrão para palavras-chave e datas no formato dd/mm/yyyy
-        keywords_pattern = "|".join(map(re.escape, keywords))
-        regex = rf"(?:\b({keywords_pattern})\b|(\d{{2}})/(\d{{2}})/(\d{{4}}))"
-
-        # Encontra todas as correspondências no texto
-        matches = re.findall(regex, text, re.IGNORECASE)
-
-        results = []
-        for match in matches:
-            if match[0]:  # Palavra-chave encontrada
-                results.append(match[0])
-            else:  # Data encontrada
-                results.append(f"{match[1]}/{match[2]}/{match[3]}")
-
-        return results
+        # Encontra todas as palavras-chave e datas no formato dd/mm/yyyy
+        # (a ocorrência inteira já é a palavra-chave ou a data, sem precisar
+        # remontá-la a partir dos grupos)
+        return _compile_keywords_and_dates_re(tuple(keywords)).findall(text)
 
     @staticmethod
     def remove_illegal_characters(text):
@@ -680,11 +1097,11 @@ class TextUtils:
 
         Detalhes
         --------
-        - O método define uma lista de caracteres ilegais
-          (`ILLEGAL_CHARACTERS`), que inclui caracteres de controle ASCII de
+        - Os caracteres ilegais são definidos na constante de módulo
+          `ILLEGAL_CHARACTERS`, que inclui caracteres de controle ASCII de
           0 a 31.
-        - Para cada caractere na lista, o método remove suas ocorrências na
-          string de entrada.
+        - Todos os caracteres da lista são removidos em uma única passagem
+          sobre a string, com `str.translate`.
 
         Exemplos
         --------
@@ -701,45 +1118,8 @@ class TextUtils:
           alterações.
         - A lista de caracteres ilegais pode ser expandida conforme necessário.
         """
-        # Lista de caracteres ilegais com descrições
-        illegal_characters = [
-            chr(0),  # Null
-            chr(1),  # Início de cabeçalho
-            chr(2),  # Início de texto
-            chr(3),  # Fim de texto
-            chr(4),  # Fim de transmissão
-            chr(5),  # Consulta
-            chr(6),  # Reconhecimento
-            chr(7),  # Sinal sonoro (bell)
-            chr(8),  # Backspace
-            chr(9),  # Tabulação horizontal
-            chr(10),  # Line feed (nova linha)
-            chr(11),  # Tabulação vertical
-            chr(12),  # Form feed
-            chr(13),  # Retorno de carro
-            chr(14),  # Shift out
-            chr(15),  # Shift in
-            chr(16),  # Data link escape
-            chr(17),  # Controle de dispositivo 1
-            chr(18),  # Controle de dispositivo 2
-            chr(19),  # Controle de dispositivo 3
-            chr(20),  # Controle de dispositivo 4
-            chr(21),  # Negative acknowledgment
-            chr(22),  # Synchronous idle
-            chr(23),  # End of transmission block
-            chr(24),  # Cancel
-            chr(25),  # End of medium
-            chr(26),  # Substituto
-            chr(27),  # Escape
-            chr(28),  # Separador de arquivo
-            chr(29),  # Separador de grupo
-            chr(30),  # Separador de registro
-            chr(31),  # Separador de unidade
-        ]
-
         if isinstance(text, str):
-            for char in illegal_characters:
-                text = text.replace(char, "")
+            return text.translate(_ILLEGAL_CTRL_TABLE)
         return text
 
     @staticmethod
@@ -768,11 +1148,8 @@ class TextUtils:
             # Saída: ["a", "b", "c"]
         ```
         """
-        if "" in lista:
-            empty_index = lista.index("")
-            return [item for item in lista[:empty_index] if item != ""]
-
-        return [item for item in lista if item != ""]
+        # Uma única passagem, interrompida no primeiro item vazio
+        return list(takewhile(_IS_NOT_EMPTY, lista))
 
     @staticmethod
     def ensure_utf8(text: str) -> str:
@@ -801,27 +1178,28 @@ class TextUtils:
         ```
 
         Detalhes da Implementação:
-            1. Usa uma expressão regular (`\\uXXXX`) para detectar sequências de
-               escape Unicode no texto.
-            2. Se essas sequências são encontradas, decodifica o texto com
+            1. Textos sem a sequência literal `\\u` são retornados sem
+               alterações, sem executar a expressão regular.
+            2. Usa uma expressão regular (`\\uXXXX`) para detectar sequências
+               de escape Unicode no texto; sem nenhuma, o texto é retornado
+               sem alterações.
+            3. Se essas sequências são encontradas, decodifica o texto com
                `unicode_escape` para converter as sequências para caracteres
-               reais.
-            3. Finalmente, o texto é re-encodado e decodificado em UTF-8 para
-               garantir a compatibilidade com essa codificação.
+               reais. Strings Python já são Unicode, então o resultado não
+               precisa ser re-encodado em UTF-8. Se a decodificação falhar
+               (outra sequência inválida no mesmo texto), o texto é retornado
+               sem alterações.
+            4. Os resultados dos últimos `CONVERSION_CACHE_SIZE` textos com
+               `\\u` ficam em cache (veja `clear_conversion_cache`).
 
         Observação:
             Esse método é especialmente útil para strings que incluem códigos
             Unicode escapados, como `\\u00E9` para `é`.
         """
-        # Expressão regular para encontrar padrões unicode escapados (\uXXXX)
-        unicode_escape_pattern = re.compile(r"\\u[0-9a-fA-F]{4}")
-
-        # Se a string contém caracteres unicode escapados, decodificá-la
-        if unicode_escape_pattern.search(text):
-            text = decode(text, "unicode_escape")
-
-        # Certificar-se de que a string esteja em formato UTF-8
-        return text.encode("utf-8").decode("utf-8")
+        # Sem a sequência "\u" não há escapes a decodificar
+        if "\\u" not in text:
+            return text
+        return _decode_unicode_escapes(text)
 
     @staticmethod
     def to_number_str(value: Union[int, float, str]) -> str:
@@ -869,16 +1247,39 @@ class TextUtils:
                 - Se não, retorna o `float` como string, preservando os
                 decimais.
             2. Caso a conversão para `float` falhe, retorna o valor original.
+            3. Inteiros são convertidos diretamente (sem passar por `float`),
+               e strings sem nenhum dígito que não sejam "inf"/"nan" são
+               descartadas sem tentar a conversão, evitando o custo de
+               levantar e tratar a exceção no caso comum de texto não
+               numérico.
+            4. As conversões bem-sucedidas de strings e floats ficam em cache
+               (últimos `CONVERSION_CACHE_SIZE` valores; veja
+               `clear_conversion_cache`). Falhas não são guardadas, e o aviso
+               no log continua sendo emitido a cada ocorrência.
         """
+        # `bool` é subclasse de `int`, mas deve seguir pela conversão para
+        # `float` ("1"/"0"), como antes
+        if type(value) is int:  # pylint: disable=unidiomatic-typecheck
+            return str(value)
+        if (
+            isinstance(value, str)
+            and not _DIGIT_RE.search(value)
+            and value.strip().lstrip("+-").lower() not in _FLOAT_WORDS
+        ):
+            logger.warning(
+                "Falha ao converter valor: %s. Retornando o valor original: %s.",  # noqa: E501  # pylint: disable=line-too-long
+                "valor sem dígitos",
+                value,
+            )
+            return value
         try:
-            # Tentar converter o valor para float
-            float_value = float(value)
-            if float_value.is_integer():
-                # Remover zeros desnecessários convertendo para int se possível
-                return str(int(float_value))
-
-            # Não é inteiro, retorna float.
-            return str(float_value)
+            # Tentar converter o valor para float. Strings e floats (os
+            # valores que se repetem entre registros) passam pelo cache; os
+            # demais tipos, que podem não ser hashable, são convertidos
+            # diretamente
+            if type(value) in (str, float):
+                return _float_to_number_str(value)
+            return _float_to_number_str.__wrapped__(value)
         except ValueError as err:
             logger.warning(
                 "Falha ao converter valor: %s. Retornando o valor original: %s.",  # noqa: E501  # pylint: disable=line-too-long
@@ -887,6 +1288,79 @@ class TextUtils:
             )
         return str(value)
 
+    @classmethod
+    def to_number_str_array(cls, values: Iterable) -> List:
+        """
+        Aplica `to_number_str` a uma sequência de valores (por exemplo, uma
+        coluna de um DataFrame), com o mesmo resultado para cada elemento.
+        Colunas numéricas (int, float, bool) são convertidas em lote com
+        operações vetorizadas do NumPy.
+
+        Parâmetros:
+            values (Iterable): Os valores a serem convertidos (lista, array
+                do NumPy ou `pd.Series`).
+
+        Retorna:
+            List: Os valores convertidos, na mesma ordem da entrada, como em
+                `to_number_str`: strings numéricas sem zeros desnecessários ou
+                o valor original, se não for possível convertê-lo.
+
+        Exemplo de Uso:
+            to_number_str_array(["3.0", 3.5, "abc", 7])
+            ['3', '3.5', 'abc', '7']
+
+        Detalhes da Implementação:
+            - Colunas de inteiros (e booleanos, como "1"/"0") são formatadas
+              diretamente, sem passar por `float`, preservando todos os
+              dígitos.
+            - Em colunas de floats, os valores inteiros (3.0) e os demais são
+              formatados em lote, escolhidos por uma máscara; NaN e inteiros
+              fora do intervalo de int64 seguem para `to_number_str`.
+            - Colunas de texto ou de tipos mistos seguem para
+              `to_number_str`, um a um: o `float` do Python é a referência de
+              conversão das strings (e `pd.to_numeric` nem sempre chega ao
+              mesmo valor). Os resultados se beneficiam do cache de
+              `to_number_str`, e os avisos no log são mantidos.
+        """
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+        import pandas as pd
+
+        if not isinstance(values, (pd.Series, np.ndarray)):
+            values = list(values)
+        series = pd.Series(values)
+        if series.empty:
+            return []
+        kind = series.dtype.kind
+        if not isinstance(series.dtype, np.dtype) or kind not in "biuf":
+            # Texto, tipos mistos e tipos sem representação em NumPy
+            # (nullable, por exemplo). Os valores originais são usados, e
+            # não os da série, em que o pandas troca None por NaN
+            if not isinstance(values, list):
+                values = values.tolist()
+            return list(map(cls.to_number_str, values))
+
+        array = series.to_numpy()
+        if kind == "b":
+            # `to_number_str(True)` é "1", e não "True"
+            array = array.astype(np.int64)
+        # `map(str, ...)` sobre os valores nativos é mais rápido que
+        # `astype(str)`, que passa por um array de strings do NumPy
+        if kind != "f":
+            return list(map(str, array.tolist()))
+
+        result = np.empty(len(array), dtype=object)
+        result[:] = list(map(str, array.tolist()))
+        with np.errstate(invalid="ignore"):
+            is_whole = array % 1 == 0
+        # Floats inteiros (3.0) são formatados como int, sem o ".0"
+        is_int = is_whole & (np.abs(array) < 2**63)
+        result[is_int] = list(map(str, array[is_int].astype(np.int64).tolist()))
+        # Falhas de conversão (NaN) e inteiros grandes demais para int64
+        for index in np.flatnonzero(np.isnan(array) | (is_whole & ~is_int)):
+            result[index] = cls.to_number_str(float(array[index]))
+        return result.tolist()
+
     @staticmethod
     def replace_comma_with_dot(text: str) -> str:
         """
@@ -913,9 +1387,88 @@ class TextUtils:
             - O método utiliza uma expressão regular para encontrar padrões de
               números no formato `<número>,<número>` e substitui a vírgula pelo
               ponto decimal.
+            - Para uma coluna inteira de um DataFrame, prefira
+              `replace_comma_with_dot_series` a
+              `.apply(TextUtils.replace_comma_with_dot)`.
         """
         # Substitui as vírgulas entre números por pontos decimais.
-        return re.sub(r"(\d+),(\d+)", r"\1.\2", text)
+        return _COMMA_NUMBER_RE.sub(r"\1.\2", text)
+
+    @staticmethod
+    def batch_replace_comma_with_dot(texts: Iterable[str]) -> List[str]:
+        """
+        Aplica `replace_comma_with_dot` a uma sequência de textos (por
+        exemplo, uma coluna de um DataFrame), com uma única execução do
+        regex para o lote inteiro.
+
+        Parâmetros:
+            texts (Iterable[str]): Textos de entrada contendo números com
+                vírgulas.
+
+        Retorna:
+            List[str]: Os textos com os números ajustados, na mesma ordem da
+                entrada.
+
+        Exemplo de Uso:
+            batch_replace_comma_with_dot(["1,5 mg", "sem número", "2,25"])
+            ['1.5 mg', 'sem número', '2.25']
+
+        Detalhes da Implementação:
+            - Os textos são unidos por um caractere separador ("\\x00"), que
+              não pode fazer parte de uma correspondência, o regex é aplicado
+              uma vez sobre o texto unido e o resultado é separado de volta.
+              Assim o laço sobre os textos fica em C (`join`/`split`), sem
+              uma chamada Python por elemento.
+            - Se algum texto contiver o próprio separador, cada texto é
+              processado individualmente.
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        joined = _BATCH_SEPARATOR.join(texts)
+        if joined.count(_BATCH_SEPARATOR) != len(texts) - 1:
+            return [_COMMA_NUMBER_RE.sub(r"\1.\2", text) for text in texts]
+        return _COMMA_NUMBER_RE.sub(r"\1.\2", joined).split(_BATCH_SEPARATOR)
+
+    @staticmethod
+    def replace_comma_with_dot_series(series: "pd.Series") -> "pd.Series":
+        """
+        Aplica `replace_comma_with_dot` a uma coluna (`pd.Series`) de um
+        DataFrame, sem uma chamada Python por célula.
+
+        Parâmetros:
+            series (pd.Series): Coluna com os textos contendo números com
+                vírgulas.
+
+        Retorna:
+            pd.Series: Uma nova série com os números ajustados, com o mesmo
+                índice, nome e tipo de `series`. Valores ausentes (None, NaN)
+                são mantidos.
+
+        Exemplo de Uso:
+            df["dose"] = TextUtils.replace_comma_with_dot_series(df["dose"])
+
+        Detalhes da Implementação:
+            - Colunas apenas com strings usam `batch_replace_comma_with_dot`,
+              com uma única execução do regex para a coluna inteira; nas
+              medições, isso foi mais rápido que `Series.str.replace`, que
+              executa o regex célula a célula.
+            - Colunas com valores ausentes ou de outros tipos usam
+              `Series.str.replace` com o mesmo regex compilado.
+        """
+        # pylint: disable=import-outside-toplevel
+        import pandas as pd
+
+        if not series.hasnans and pd.api.types.infer_dtype(
+            series, skipna=False
+        ) in ("string", "empty"):
+            return pd.Series(
+                TextUtils.batch_replace_comma_with_dot(series),
+                index=series.index,
+                name=series.name,
+                dtype=series.dtype,
+            )
+        return series.str.replace(_COMMA_NUMBER_RE, r"\1.\2", regex=True)
 
     @staticmethod
     def remove_dot_between_numbers(text: str) -> str:
@@ -943,7 +1496,46 @@ class TextUtils:
                string vazia,  efetivamente removendo o ponto.
         """
         # Substitui o ponto entre números por uma string vazia.
-        return re.sub(r"(\d)\.(\d)", r"\1\2", text)
+        return _DOT_NUMBER_RE.sub(r"\1\2", text)
+
+    @staticmethod
+    def normalize_decimal_separators(text: str) -> str:
+        """
+        Converte os números de um texto do formato brasileiro para o formato
+        com ponto decimal, removendo os pontos entre dígitos (separador de
+        milhar) e substituindo as vírgulas entre dígitos por pontos.
+
+        Equivale a aplicar `remove_dot_between_numbers` e, em seguida,
+        `replace_comma_with_dot`, mas, no caso comum, faz uma única
+        substituição, sem a string intermediária.
+
+        Parâmetros:
+            text (str): Texto de entrada contendo números no formato
+                brasileiro.
+
+        Retorna:
+            str: Texto com os números no formato com ponto decimal.
+
+        Exemplo de Uso:
+            normalize_decimal_separators("Total: 1.234,56 e 7,5.")
+            'Total: 1234.56 e 7.5.'
+
+        Detalhes da Implementação:
+            - Apenas os separadores são capturados (os dígitos vizinhos são
+              verificados com lookbehind/lookahead), e cada um é trocado pelo
+              seu substituto.
+            - Textos com separadores sobrepostos (ex.: "1.2.3" ou "1,2,3")
+              recebem as duas substituições em sequência, que deixam parte
+              deles inalterada ("12.3" e "1.2,3"), mantendo o resultado
+              idêntico ao das chamadas separadas.
+        """
+        if _OVERLAPPING_SEPARATORS_RE.search(text):
+            return _COMMA_NUMBER_RE.sub(
+                r"\1.\2", _DOT_NUMBER_RE.sub(r"\1\2", text)
+            )
+        return _DECIMAL_SEPARATOR_RE.sub(
+            lambda match: _DECIMAL_SEPARATOR_REPLACEMENTS[match[0]], text
+        )
 
     @staticmethod
     def remove_special_characters_preserving_accents(texto):
@@ -969,9 +1561,14 @@ class TextUtils:
         explicitamente permitidos pela classe de caracteres \\s, eles
         permanecem no texto final.
         """
+        # Textos ASCII usam a tabela de `str.translate`, que tem um caminho
+        # otimizado em C para esse caso; nos demais, o regex é mais rápido que
+        # a consulta à tabela para cada caractere
+        if texto.isascii():
+            return texto.translate(_SPECIAL_ASCII_TABLE)
         # Substituir caracteres que não são letras com acentos, números ou
         # espaços
-        clear_text = re.sub(r"[^\w\sÀ-ÿ]", "", texto)
+        clear_text = _SPECIAL_CHARS_RE.sub("", texto)
         return clear_text
 
     @staticmethod
@@ -990,6 +1587,11 @@ class TextUtils:
             tuple: Uma tupla contendo a palavra encontrada (ou None) e o texto
                 sem a palavra encontrada.
 
+        Observação:
+            Vale a primeira ocorrência no texto. Se mais de uma palavra puder
+            ser encontrada na mesma posição (ex.: "caixa" e "caixa com"), é
+            escolhida a que aparece primeiro em `key_words`.
+
         Exemplo de Uso:
         ```
             key_words = ['caixa', 'blister', 'frascos']
@@ -1001,18 +1603,18 @@ class TextUtils:
         ```
         """
         # Cria um padrão regex com todas as palavras do dicionário
-        pattern = (
-            r"\b(" + "|".join(re.escape(word) for word in key_words) + r")\b"
-        )
+        # (em forma de trie e em cache; veja `_compile_word_trie_re`)
+        pattern = _compile_word_trie_re(tuple(key_words))
 
         # Procura no texto
-        match = re.search(pattern, text, flags=re.IGNORECASE)
+        match = pattern.search(text)
 
         if match:
             found_word = match.group(1)
-            text_without_word = re.sub(
-                pattern, "", text, count=1, flags=re.IGNORECASE
-            ).strip()
+            # Remove a ocorrência já localizada pelas suas posições, sem uma
+            # segunda execução do regex
+            start, end = match.span()
+            text_without_word = (text[:start] + text[end:]).strip()
             return found_word, text_without_word
 
         return None, text
@@ -1043,13 +1645,15 @@ class TextUtils:
                '/zytiga-250mg-120-comprimidos']
         ```
         """
-        # Expressão regular para capturar URLs HTTP e HTTPS
-        url_pattern = r"https?://[^\s]+"
-        return re.findall(url_pattern, text)
+        # O padrão começa pelo literal "http", que o `re` localiza com uma
+        # busca de prefixo em C antes de executar o restante do padrão; nas
+        # medições, isso foi mais rápido que localizar as ocorrências com
+        # `str.find` e validar cada uma em Python
+        return _URL_RE.findall(text)
 
     @staticmethod
     def extract_all_dates_as_datetime(
-        text: str, date_pattern: str = r"\b\d{2}/\d{2}/\d{4}\b"
+        text: str, date_pattern: Optional[Union[str, re.Pattern]] = None
     ) -> List[datetime]:
         """
         Extrai todas as datas de um texto e as converte para objetos datetime.
@@ -1059,8 +1663,11 @@ class TextUtils:
         text : str
             O texto de entrada no qual as datas serão procuradas.
 
-        date_pattern : str, opcional
-            O padrão de expressão regular para identificar as datas.
+        date_pattern : str ou re.Pattern, opcional
+            O padrão de expressão regular para identificar as datas. Por
+            padrão, datas no formato dd/mm/yyyy (`\\b\\d{2}/\\d{2}/\\d{4}\\b`).
+            Pode ser informado já compilado (`re.compile`), o que evita a
+            consulta ao cache de padrões em chamadas repetidas.
 
         Retorna:
         --------
@@ -1080,13 +1687,22 @@ class TextUtils:
             #         datetime.datetime(2025, 1, 1, 0, 0)]
         """
         # Busca todas as datas no formato especificado
-        raw_dates = re.findall(date_pattern, text)
+        if date_pattern is None:
+            raw_dates = _DATE_RE.findall(text)
+            parse_date = _parse_ddmmyyyy
+        else:
+            if isinstance(date_pattern, str):
+                date_pattern = _compile_pattern(date_pattern)
+            raw_dates = date_pattern.findall(text)
+            parse_date = _strptime_ddmmyyyy
         datetime_dates = []
         for date in raw_dates:
             try:
                 # Converte a string de data para um objeto datetime
-                datetime_dates.append(datetime.strptime(date, "%d/%m/%Y"))
+                datetime_dates.append(parse_date(date))
             except ValueError as err:
                 # Ignora datas inválidas
-                print(f"Erro ao converter '{date}' para datetime: {err}")
+                logger.debug(
+                    "Erro ao converter '%s' para datetime: %s", date, err
+                )
         return datetime_dates
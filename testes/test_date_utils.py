@@ -6,3 +6,8 @@ from omniutils.date_utils import DateUtils
 def test_to_datetime():
     datetime_value = DateUtils.to_datetime(15, "março", 2023)
     assert datetime_value == datetime(2023, 3, 15)
+
+
+def test_to_datetime_accepts_unaccented_and_uppercase_month():
+    assert DateUtils.to_datetime(15, "marco", 2023) == datetime(2023, 3, 15)
+    assert DateUtils.to_datetime(15, "MARÇO", 2023) == datetime(2023, 3, 15)
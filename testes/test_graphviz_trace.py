@@ -0,0 +1,159 @@
+import contextlib
+
+import pytest  # type: ignore
+from pycallgraph2 import GlobbingFilter, Grouper  # type: ignore
+from pyinstrument import Profiler  # type: ignore
+
+from omniutils.graphviz_trace import (
+    CompiledGlobbingFilter,
+    GraphTracerAbstract,
+)
+
+
+class MyGraphTracer(GraphTracerAbstract):
+    @classmethod
+    def get_trace_filter(cls) -> GlobbingFilter:
+        return GlobbingFilter(include=["testes.*"])
+
+    @classmethod
+    def get_trace_grouper(cls) -> Grouper:
+        return Grouper(groups=["testes.*"])
+
+
+def test_compiled_globbing_filter_matches_globbing_filter():
+    include = ["meupacote.*"]
+    exclude = ["meupacote.testes.*"]
+    names = [
+        "meupacote.modulo.funcao",
+        "meupacote.testes.test_funcao",
+        "outropacote.funcao",
+    ]
+    original = GlobbingFilter(include=include, exclude=exclude)
+    compiled = CompiledGlobbingFilter(include=include, exclude=exclude)
+    assert [compiled(name) for name in names] == [
+        original(name) for name in names
+    ]
+
+
+def test_compiled_globbing_filter_from_filter():
+    original = GlobbingFilter(include=["meupacote.*"])
+    compiled = CompiledGlobbingFilter.from_filter(original)
+    assert compiled("meupacote.funcao")
+    assert not compiled("outro.funcao")
+    assert CompiledGlobbingFilter.from_filter(compiled) is compiled
+
+
+def test_trace_graph_sampled(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    @MyGraphTracer.trace_graph_sampled(interval=0.01)
+    def soma(a, b):
+        return a + b
+
+    assert soma(2, 3) == 5
+    assert list(tmp_path.glob("*soma.html"))
+
+
+def test_trace_graph_sampled_recursive_calls(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    @MyGraphTracer.trace_graph_sampled(interval=0.01)
+    def fatorial(n):
+        return 1 if n <= 1 else n * fatorial(n - 1)
+
+    assert fatorial(5) == 120
+    assert len(list(tmp_path.glob("*fatorial.html"))) == 1
+    # Após o fim da amostragem externa, uma nova amostragem é permitida
+    assert fatorial(3) == 6
+
+
+def test_trace_graph_sampled_keeps_function_exception(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    def failing_write_html(self, path):
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(Profiler, "write_html", failing_write_html)
+
+    @MyGraphTracer.trace_graph_sampled(interval=0.01)
+    def falha():
+        raise ValueError("erro da função")
+
+    # A falha ao gravar o relatório não substitui a exceção da função
+    with pytest.raises(ValueError, match="erro da função"):
+        falha()
+    assert not list(tmp_path.glob("*falha.html"))
+
+
+def test_trace_graph_preserves_wrapped_function():
+    def soma(a, b):
+        return a + b
+
+    traced = MyGraphTracer.trace_graph(soma)
+    assert traced.__wrapped__ is soma
+    assert traced.__name__ == "soma"
+
+    sampled = MyGraphTracer.trace_graph_sampled(traced)
+    assert MyGraphTracer.unwrap(sampled) is soma
+
+
+def test_get_config_is_cached_per_class():
+    class OtherGraphTracer(MyGraphTracer):
+        pass
+
+    assert MyGraphTracer.get_config() is MyGraphTracer.get_config()
+    assert MyGraphTracer.get_graphviz() is MyGraphTracer.get_graphviz()
+    assert OtherGraphTracer.get_config() is not MyGraphTracer.get_config()
+    assert OtherGraphTracer.get_graphviz() is not MyGraphTracer.get_graphviz()
+
+
+def test_trace_context_manager(monkeypatch):
+    calls = []
+
+    @contextlib.contextmanager
+    def dummy_pycallgraph(output, config):  # pylint: disable=unused-argument
+        calls.append(output.output_file)
+        yield
+
+    # Evita a geração real do diagrama, que depende do executável do Graphviz
+    monkeypatch.setattr(
+        "omniutils.graphviz_trace.PyCallGraph", dummy_pycallgraph
+    )
+
+    with MyGraphTracer.trace("etl"):
+        pass
+
+    @MyGraphTracer.trace_graph
+    def soma(a, b):
+        return a + b
+
+    assert soma(2, 3) == 5
+    assert calls == ["etl.png", f"{__name__}.{soma.__qualname__}.png"]
+
+
+def test_trace_graph_nested_calls_are_traced_once(monkeypatch):
+    calls = []
+
+    @contextlib.contextmanager
+    def dummy_pycallgraph(output, config):  # pylint: disable=unused-argument
+        calls.append(output.output_file)
+        yield
+
+    monkeypatch.setattr(
+        "omniutils.graphviz_trace.PyCallGraph", dummy_pycallgraph
+    )
+
+    @MyGraphTracer.trace_graph
+    def interna():
+        return 1
+
+    @MyGraphTracer.trace_graph
+    def externa():
+        return interna() + 1
+
+    assert externa() == 2
+    assert len(calls) == 1
+
+    # Após o fim do rastreamento externo, um novo rastreamento é permitido
+    assert interna() == 1
+    assert len(calls) == 2
@@ -0,0 +1,42 @@
+import msgspec
+import pytest  # type: ignore
+
+from omniutils.json_operator import JsonOperator
+
+
+def test_load_json_many(tmp_path):
+    paths = []
+    for i in range(5):
+        file_path = tmp_path / f"config_{i}.json"
+        JsonOperator.save_json(str(file_path), {"id": i})
+        paths.append(str(file_path))
+
+    result = JsonOperator.load_json_many(paths)
+    # A ordem do resultado deve ser a mesma dos caminhos informados
+    assert result == [{"id": i} for i in range(5)]
+
+
+def test_load_json_many_file_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        JsonOperator.load_json_many([str(tmp_path / "inexistente.json")])
+
+
+class Pessoa(msgspec.Struct):
+    nome: str
+    idade: int
+
+
+def test_load_json_as(tmp_path):
+    file_path = tmp_path / "pessoa.json"
+    JsonOperator.save_json(str(file_path), {"nome": "João", "idade": 30})
+
+    pessoa = JsonOperator.load_json_as(str(file_path), Pessoa)
+    assert pessoa == Pessoa(nome="João", idade=30)
+
+
+def test_load_json_as_invalid_schema(tmp_path):
+    file_path = tmp_path / "pessoa.json"
+    JsonOperator.save_json(str(file_path), {"nome": "João", "idade": "30"})
+
+    with pytest.raises(ValueError):
+        JsonOperator.load_json_as(str(file_path), Pessoa)
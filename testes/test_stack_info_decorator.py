@@ -0,0 +1,282 @@
+import copy
+import inspect
+import logging
+import re
+import sys
+
+from omniutils import stack_info_decorator
+from omniutils.stack_info_decorator import StackLoggerAbstract
+
+
+class MyStackLogger(StackLoggerAbstract):
+    def get_framework_name(self) -> str:
+        return "testes"
+
+
+stack_logger = MyStackLogger()
+
+
+@stack_logger.stack_log
+def soma(a, b):
+    return a + b
+
+
+def chamador():
+    return soma(2, b=3)
+
+
+def test_stack_log_logs_hierarchy_args_and_result(caplog):
+    with caplog.at_level(
+        logging.DEBUG, logger="omniutils.stack_info_decorator"
+    ):
+        assert chamador() == 5
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert re.fullmatch(
+        r"\[\d+\]test_stack_info_decorator\."
+        r"test_stack_log_logs_hierarchy_args_and_result > "
+        r"\[\d+\]test_stack_info_decorator\.chamador > "
+        rf"\[{soma.__wrapped__.__code__.co_firstlineno}\]"
+        r"test_stack_info_decorator\.soma",
+        messages[0],
+    )
+    assert messages[1] == "args: (2,), kwargs: {'b': 3}"
+    assert messages[2] == "retorno: 5"
+    assert [record.verbose for record in caplog.records] == [1, 2, 2]
+
+
+def test_stack_log_preserves_function_metadata():
+    assert soma.__name__ == "soma"
+    assert soma.__wrapped__(1, 1) == 2
+
+
+class Exemplo:
+    def frame_atual(self):
+        return sys._getframe()  # pylint: disable=protected-access
+
+
+def test_get_module_and_class_name_accept_frame_or_frame_info():
+    frame = Exemplo().frame_atual()
+    frame_info = inspect.getframeinfo(frame)
+    frame_info = inspect.FrameInfo(frame, *frame_info)
+    for value in (frame, frame_info):
+        assert StackLoggerAbstract.get_module_name(value) == (
+            "testes",
+            "test_stack_info_decorator",
+        )
+        assert StackLoggerAbstract.get_class_name(value) == "Exemplo"
+
+
+class ChamadaViaOutroModulo:
+    """Chamada a partir de um frame de fora do framework (módulo `copy`)."""
+
+    def __deepcopy__(self, memo):
+        return chamador()
+
+
+def test_stack_log_stops_at_first_frame_outside_framework(caplog):
+    with caplog.at_level(
+        logging.DEBUG, logger="omniutils.stack_info_decorator"
+    ):
+        assert copy.deepcopy(ChamadaViaOutroModulo()) == 5
+    hierarchy = caplog.records[0].getMessage()
+    assert hierarchy.split(" > ")[0].endswith(
+        "test_stack_info_decorator.__deepcopy__"
+    )
+
+
+def test_stack_log_full_scan_when_not_strict(caplog, monkeypatch):
+    monkeypatch.setattr(MyStackLogger, "STRICT_CONTIGUOUS", False)
+    with caplog.at_level(
+        logging.DEBUG, logger="omniutils.stack_info_decorator"
+    ):
+        assert copy.deepcopy(ChamadaViaOutroModulo()) == 5
+    hierarchy = caplog.records[0].getMessage()
+    assert hierarchy.split(" > ")[0].endswith(
+        "test_stack_info_decorator.test_stack_log_full_scan_when_not_strict"
+    )
+
+
+def test_stack_log_caches_module_per_code_object(monkeypatch, caplog):
+    calls = []
+    get_module_name = StackLoggerAbstract.get_module_name
+
+    def spy_get_module_name(frame_info):
+        calls.append(frame_info)
+        return get_module_name(frame_info)
+
+    monkeypatch.setattr(
+        MyStackLogger, "get_module_name", staticmethod(spy_get_module_name)
+    )
+    monkeypatch.setattr(stack_info_decorator, "_CODE_META_CACHE", {})
+
+    with caplog.at_level(
+        logging.DEBUG, logger="omniutils.stack_info_decorator"
+    ):
+        chamador()
+        first_call = len(calls)
+        chamador()
+    assert first_call > 0
+    assert len(calls) == first_call
+
+
+def test_stack_log_without_source_code(caplog):
+    namespace = {"__name__": "testes.gerado"}
+    exec(  # pylint: disable=exec-used
+        "def gerada():\n    return 1\n", namespace
+    )
+    gerada = stack_logger.stack_log(namespace["gerada"])
+
+    with caplog.at_level(
+        logging.DEBUG, logger="omniutils.stack_info_decorator"
+    ):
+        assert gerada() == 1
+    assert caplog.records[0].getMessage().endswith("[1]gerado.gerada")
+
+
+def test_stack_log_skips_work_when_debug_disabled(monkeypatch, caplog):
+    def fail_collect(*args, **kwargs):
+        raise AssertionError("a pilha não deveria ser percorrida")
+
+    monkeypatch.setattr(
+        MyStackLogger, "_collect_framework_frames", fail_collect
+    )
+    with caplog.at_level(logging.INFO, logger="omniutils.stack_info_decorator"):
+        assert chamador() == 5
+    assert not caplog.records
+
+
+def test_stack_log_sections_can_be_disabled(monkeypatch, caplog):
+    monkeypatch.setattr(MyStackLogger, "_verbose1_enabled", lambda self: False)
+    with caplog.at_level(
+        logging.DEBUG, logger="omniutils.stack_info_decorator"
+    ):
+        assert chamador() == 5
+    assert [record.getMessage() for record in caplog.records] == [
+        "args: (2,), kwargs: {'b': 3}",
+        "retorno: 5",
+    ]
+
+
+class ReprCaro:
+    """Objeto cuja representação não deve ser calculada sem necessidade."""
+
+    reprs = 0
+
+    def __repr__(self):
+        ReprCaro.reprs += 1
+        return "ReprCaro()"
+
+
+def test_stack_log_formats_args_only_when_emitted(monkeypatch):
+    class SomenteHierarquia(logging.Filter):
+        def filter(self, record):
+            return getattr(record, "verbose", 0) < 2
+
+    identidade = stack_logger.stack_log(lambda valor: valor)
+    records = []
+    handler = logging.Handler()
+    handler.emit = lambda record: records.append(record.getMessage())
+    handler.addFilter(SomenteHierarquia())
+    log = logging.getLogger("omniutils.stack_info_decorator")
+    monkeypatch.setattr(log, "level", logging.DEBUG)
+    monkeypatch.setattr(log, "propagate", False)
+    log.addHandler(handler)
+    try:
+        ReprCaro.reprs = 0
+        identidade(ReprCaro())
+    finally:
+        log.removeHandler(handler)
+
+    assert len(records) == 1
+    assert ReprCaro.reprs == 0
+
+
+def test_stack_log_without_framework_returns_function():
+    class SemFramework(StackLoggerAbstract):
+        def get_framework_name(self) -> str:
+            return ""
+
+    def funcao():
+        return 1
+
+    assert SemFramework().stack_log(funcao) is funcao
+
+
+def test_get_module_name_uses_frame_globals():
+    namespace = {"__name__": "pacote.sub.modulo"}
+    exec(  # pylint: disable=exec-used
+        "import sys\nframe = sys._getframe()\n", namespace
+    )
+    assert StackLoggerAbstract.get_module_name(namespace["frame"]) == (
+        "pacote",
+        "modulo",
+    )
+    del namespace["__name__"]
+    assert StackLoggerAbstract.get_module_name(namespace["frame"]) == (
+        None,
+        None,
+    )
+
+
+def test_get_class_name_outside_method():
+    # pylint: disable-next=protected-access
+    assert StackLoggerAbstract.get_class_name(sys._getframe()) is None
+
+
+def test_stack_log_batch_records(monkeypatch, caplog):
+    monkeypatch.setattr(MyStackLogger, "BATCH_RECORDS", True)
+    with caplog.at_level(
+        logging.DEBUG, logger="omniutils.stack_info_decorator"
+    ):
+        assert chamador() == 5
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 2
+    hierarchy, details = messages[0].split("\n")
+    assert hierarchy.endswith("test_stack_info_decorator.soma")
+    assert details == "args: (2,), kwargs: {'b': 3}"
+    assert messages[1] == "retorno: 5"
+
+
+def test_stack_log_with_framework_name_attribute(caplog):
+    class ComAtributo(StackLoggerAbstract):
+        FRAMEWORK_NAME = "testes"
+
+    @ComAtributo().stack_log
+    def dobro(valor):
+        return valor * 2
+
+    with caplog.at_level(
+        logging.DEBUG, logger="omniutils.stack_info_decorator"
+    ):
+        assert dobro(4) == 8
+    assert (
+        caplog.records[0]
+        .getMessage()
+        .endswith("test_stack_info_decorator.dobro")
+    )
+    assert ComAtributo().get_framework_name() == "testes"
+
+
+def test_stack_log_skips_work_without_handlers(monkeypatch):
+    def fail_collect(*args, **kwargs):
+        raise AssertionError("a pilha não deveria ser percorrida")
+
+    log = logging.getLogger("omniutils.stack_info_decorator")
+    monkeypatch.setattr(log, "level", logging.DEBUG)
+    monkeypatch.setattr(log, "propagate", False)
+    monkeypatch.setattr(log, "handlers", [])
+    monkeypatch.setattr(
+        MyStackLogger, "_collect_framework_frames", fail_collect
+    )
+    assert chamador() == 5
+
+
+def test_stack_log_disabled_by_environment(monkeypatch):
+    monkeypatch.setattr(stack_info_decorator, "STACK_LOG_ENABLED", False)
+
+    def funcao():
+        return 1
+
+    assert stack_logger.stack_log(funcao) is funcao
@@ -1,7 +1,12 @@
+import random
+import re
+import unicodedata
 from datetime import datetime
 
+import pandas as pd
 import pytest  # type: ignore # pylint: disable=import-error
 
+from omniutils import text_utils
 from omniutils.text_utils import TextUtils
 
 
@@ -60,6 +65,23 @@ def test_extract_content_after_keyword1():
     assert "120" in result and "comprimidos" in result
 
 
+def test_extract_content_after_keyword_reuses_compiled_pattern():
+    # Listas iguais (mesmo que objetos diferentes) reaproveitam o padrão
+    # compilado em cache
+    text = "Valor da caixa: 120 comprimidos."
+    first = TextUtils.extract_content_after_keyword(
+        text, keyword="Valor", stopwords=["da"]
+    )
+    info = text_utils._compile_after_keyword_re.cache_info()
+    second = TextUtils.extract_content_after_keyword(
+        text, keyword="Valor", stopwords=["da"]
+    )
+    assert first == second == "caixa: 120 comprimidos."
+    assert text_utils._compile_after_keyword_re.cache_info().hits == (
+        info.hits + 1
+    )
+
+
 def test_extract_content_after_keyword2():
     text = "Produto: válido [ABC-123], especial - em estoque."
     special_chars_pattern = r"[\\[\\],.-]"
@@ -108,6 +130,14 @@ def test_ensure_utf8():
     assert result == "Hello é"
 
 
+@pytest.mark.parametrize(
+    "text",
+    ["Hello World", "Coração", "C:\\users\\x", "", "C:\\\\users", "ã/\\\\ub"],
+)
+def test_ensure_utf8_without_escapes_returns_same_object(text):
+    assert TextUtils.ensure_utf8(text) is text
+
+
 def test_extract_http_address():
     text = "Acesse https://www.example.com e http://teste.com para mais informações."  # noqa: E501  # pylint: disable=line-too-long
     urls = TextUtils.extract_http_address(text)
@@ -125,3 +155,456 @@ def test_extract_all_dates_as_datetime():
     ]
     for datetime_value, exp in zip(dates, expected_dates):
         assert datetime_value == exp
+
+
+def test_remove_illegal_characters():
+    text = "Olá\x00 Mu\tndo\r\n" + "".join(map(chr, range(32))) + "\x7f"
+    assert TextUtils.remove_illegal_characters(text) == "Olá Mundo\x7f"
+    assert TextUtils.remove_illegal_characters(None) is None
+
+
+def test_normalize_text_removes_combining_marks():
+    assert (
+        TextUtils.normalize_text("  São Paulo, ÀÉÎÕÜ ñ ç  ")
+        == "sao paulo, aeiou n c"
+    )
+    assert TextUtils.normalize_text(None) is None
+
+
+@pytest.mark.parametrize(
+    "text", ["Hello World!", "Arquivo com espaco.pdf", "  ABC_123 - x  "]
+)
+def test_normalizers_ascii_fast_path(text):
+    # O caminho rápido para ASCII deve produzir o mesmo resultado que a
+    # normalização Unicode completa
+    expected_str = re.sub(
+        r"[^A-Za-z0-9_]+",
+        "-",
+        unicodedata.normalize("NFKD", text.replace(" ", "+").lower()),
+    )
+    assert TextUtils.normalize_str(text, "-", "+") == expected_str
+    assert TextUtils.normalize_text(text) == text.lower().strip()
+
+
+def test_normalizers_latin1_table_matches_unicode_normalization():
+    # Para texto Latin-1, as tabelas pré-calculadas devem produzir o mesmo
+    # resultado que a normalização Unicode completa
+    latin1 = "".join(map(chr, range(0x80, 0x100)))
+    text = f"Coração {latin1} Ação"
+    expected_str = re.sub(
+        r"[^A-Za-z0-9_]+",
+        "",
+        unicodedata.normalize("NFKD", text.replace(" ", "_").lower()),
+    )
+    expected_text = (
+        "".join(
+            c
+            for c in unicodedata.normalize("NFD", text)
+            if unicodedata.category(c) != "Mn"
+        )
+        .lower()
+        .strip()
+    )
+    assert TextUtils.normalize_str(text) == expected_str
+    assert TextUtils.normalize_text(text) == expected_text
+
+
+def _normalize_text_reference(text):
+    return (
+        "".join(
+            c
+            for c in unicodedata.normalize("NFD", text)
+            if unicodedata.category(c) != "Mn"
+        )
+        .lower()
+        .strip()
+    )
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_normalize_text_matches_mn_filter(seed):
+    # Apenas as marcas não espaçadoras ("Mn") são removidas, em qualquer
+    # escrita: o dagesh do hebraico e as harakat do árabe saem, e marcas de
+    # outras categorias (como a envolvente U+20DD) permanecem
+    assert TextUtils.normalize_text("בּ") == "ב"
+    assert TextUtils.normalize_text("كَتَبَ") == "كتب"
+    assert TextUtils.normalize_text("a\u20dd") == "a\u20dd"
+    rng = random.Random(seed)
+    alphabet = [chr(code) for code in range(0x20, 0x3000)]
+    for _ in range(200):
+        text = "".join(rng.choices(alphabet, k=20))
+        assert TextUtils.normalize_text(text) == _normalize_text_reference(text)
+
+
+def test_extract_numbers_with_keywords_default_keywords():
+    text = "Solução 2,5 mg/ml, frasco 10 ML e 3 g de pó; lote 42 unidades."
+    assert TextUtils.extract_numbers_with_keywords(text) == [
+        "2,5 MG/ML",
+        "10 ML",
+        "3 G",
+    ]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "  Coração\x00 de Mãe\n",
+        "\tHello\x1fWorld ",
+        "Ελληνικά \x07άλφα",
+        "",
+        None,
+        123,
+    ],
+)
+def test_sanitize_matches_chained_calls(text):
+    expected = TextUtils.normalize_text(
+        TextUtils.remove_illegal_characters(text)
+    )
+    assert TextUtils.sanitize(text) == expected
+
+
+@pytest.mark.parametrize(
+    "lista, expected",
+    [
+        (["a", "", "b", "c"], ["a"]),
+        (["a", "b", "c"], ["a", "b", "c"]),
+        (["", "a"], []),
+        ([], []),
+        ([1, None, "a", "", 2], [1, None, "a"]),
+    ],
+)
+def test_extract_until_empty(lista, expected):
+    assert TextUtils.extract_until_empty(lista) == expected
+
+
+def test_extract_keywords_and_dates():
+    text = (
+        "Disponível em: https://exemplo.com. Acesso em 15/04/2023 e "
+        "16/04/2023."
+    )
+    assert TextUtils.extract_keywords_and_dates(text) == [
+        "Disponível",
+        "https",
+        "Acesso",
+        "15/04/2023",
+        "16/04/2023",
+    ]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("caixa 2 x 10 comprimidos x-ray", 10.0),
+        ("1 X 2,5 x3 e xarope", 3.0),
+        ("X 1.5", 15.0),
+    ],
+)
+def test_extract_number_after_last_x_skips_trailing_x(text, expected):
+    assert TextUtils.extract_number_after_last_x(text) == expected
+
+
+def test_extract_number_after_last_x_not_found():
+    with pytest.raises(ValueError):
+        TextUtils.extract_number_after_last_x("xarope sem dose")
+
+
+def test_extract_number_after_last_x_many_x_is_linear():
+    # Muitos "X" sem número depois não podem provocar uma nova varredura do
+    # texto a cada ocorrência (um milhão de "X" levaria vários segundos)
+    text = "X 7 " + "X" * 1_000_000
+    assert TextUtils.extract_number_after_last_x(text) == 7.0
+    with pytest.raises(ValueError):
+        TextUtils.extract_number_after_last_x("x" * 1_000_000)
+
+
+@pytest.mark.parametrize("space_char", ["_", "-", "", "AB", " "])
+def test_normalize_str_single_pass_table(space_char):
+    # Sem `special_char`, texto Latin-1 é normalizado por uma única tabela de
+    # `str.translate`, com o mesmo resultado das etapas completas
+    latin1 = "".join(map(chr, range(0x100)))
+    text = f"Arquivo Com Espaço.pdf {latin1} São Paulo"
+    expected = re.sub(
+        r"[^A-Za-z0-9_]+",
+        "",
+        unicodedata.normalize("NFKD", text.replace(" ", space_char).lower()),
+    )
+    assert TextUtils.normalize_str(text, space_char=space_char) == expected
+
+
+@pytest.mark.parametrize(
+    "special_char, space_char", [("", "_"), ("-", "+"), ("", "ç")]
+)
+def test_normalize_str_many(special_char, space_char):
+    texts = ["São Paulo - 2023!", "Arquivo com espaço.pdf", "Ελλάδα x", ""]
+    assert TextUtils.normalize_str_many(
+        iter(texts), special_char, space_char
+    ) == [
+        TextUtils.normalize_str(text, special_char, space_char)
+        for text in texts
+    ]
+
+
+def test_normalize_results_are_cached():
+    TextUtils.clear_normalize_cache()
+    for _ in range(3):
+        assert TextUtils.normalize_str("Coração") == "coracao"
+        assert TextUtils.normalize_text(" Coração ") == "coracao"
+    assert TextUtils.normalize_str.cache_info().hits == 2
+    assert text_utils._normalize_text.cache_info().hits == 2
+    # Valores não hashable continuam sendo retornados sem alteração
+    assert TextUtils.normalize_text(["a"]) == ["a"]
+    TextUtils.clear_normalize_cache()
+    assert TextUtils.normalize_str.cache_info().currsize == 0
+    assert text_utils._normalize_text.cache_info().currsize == 0
+
+
+@pytest.mark.parametrize(
+    "text, keyword, expected",
+    [
+        ("Produto: (  ABC-123 ) esse texto após", None, "ABC-123"),
+        ("Produto: do ( ABC 123 ) resto", "Produto", "ABC 123"),
+        ("Produto:  ABC-123 em estoque  ", "Produto", "ABC-123 em estoque"),
+        ("Vazio ( ) e depois (XYZ)", None, ""),
+    ],
+)
+def test_extract_text_between_parentheses_trims_content(
+    text, keyword, expected
+):
+    assert (
+        TextUtils.extract_text_between_parentheses(text, keyword=keyword)
+        == expected
+    )
+
+
+@pytest.mark.parametrize("keyword", [None, "Produto"])
+def test_extract_text_between_parentheses_unclosed_is_linear(keyword):
+    # Um "(" sem fechamento seguido de muitos espaços não pode provocar
+    # backtracking quadrático (milhares de espaços levavam segundos)
+    text = "Produto (" + " " * 20000
+    if keyword:
+        assert TextUtils.extract_text_between_parentheses(text, keyword) == "("
+    else:
+        with pytest.raises(ValueError):
+            TextUtils.extract_text_between_parentheses(text)
+
+
+def test_extract_all_dates_as_datetime_custom_pattern():
+    text = "Datas: 21/12/2024, 31/02/2024 e 2025-01-01."
+    assert TextUtils.extract_all_dates_as_datetime(text) == [
+        datetime(2024, 12, 21)
+    ]
+    assert TextUtils.extract_all_dates_as_datetime(
+        "21/12/2024 e 1/1/2025", date_pattern=r"\b\d{1,2}/\d{1,2}/\d{4}\b"
+    ) == [datetime(2024, 12, 21), datetime(2025, 1, 1)]
+    assert TextUtils.extract_all_dates_as_datetime(
+        "21/12/2024 e 1/1/2025",
+        date_pattern=re.compile(r"\b\d{1,2}/\d{1,2}/\d{4}\b"),
+    ) == [datetime(2024, 12, 21), datetime(2025, 1, 1)]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (3, "3"),
+        (2**60 + 1, str(2**60 + 1)),
+        (True, "1"),
+        (3.0, "3"),
+        (3.5, "3.5"),
+        ("0000025.3000000", "25.3"),
+        (" -Inf ", "-inf"),
+        ("abc", "abc"),
+        ("abc1", "abc1"),
+        (-0.0, "0"),
+        (1e20, "100000000000000000000"),
+        ("-12.0", "-12"),
+    ],
+)
+def test_to_number_str_values(value, expected):
+    assert TextUtils.to_number_str(value) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Total: 1.234,56 e 7,5.",
+        "R$ 1.234.567,89; 12,0 mg; versão 3.10",
+        "sem números, nem pontos.",
+        "1.2.3",
+        "1,2,3",
+        "1.2,3,4.5.6,7",
+        "v1.2.3, 4,5,6 e 7.8,9.",
+    ],
+)
+def test_normalize_decimal_separators_matches_chained_calls(text):
+    expected = TextUtils.replace_comma_with_dot(
+        TextUtils.remove_dot_between_numbers(text)
+    )
+    assert TextUtils.normalize_decimal_separators(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        (
+            "Valor da caixa com 120 comprimidos",
+            ("caixa", "Valor da  com 120 comprimidos"),
+        ),
+        ("Duas CAIXAS de 10", ("CAIXAS", "Duas  de 10")),
+        ("Frasco-ampola de 5 ml", ("Frasco", "-ampola de 5 ml")),
+        ("Sem embalagem", (None, "Sem embalagem")),
+        ("caixa e caixa de 10", ("caixa", "e caixa de 10")),
+        ("  Blister  ", ("Blister", "")),
+    ],
+)
+def test_find_word_in_text(text, expected):
+    key_words = ["caixa", "caixas", "blister", "frasco", "frascos"]
+    assert TextUtils.find_word_in_text(text, key_words) == expected
+
+
+@pytest.mark.parametrize(
+    "texts",
+    [
+        ["1,5 mg", "sem número", "2,25", "", "10,0,1"],
+        ["com\x00separador 1,5", "3,2"],
+        [],
+    ],
+)
+def test_batch_replace_comma_with_dot(texts):
+    assert TextUtils.batch_replace_comma_with_dot(iter(texts)) == [
+        TextUtils.replace_comma_with_dot(text) for text in texts
+    ]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        (
+            "Disponível em: https://a.com/x?y=1 e http://b.org. Acesso em",
+            ["https://a.com/x?y=1", "http://b.org."],
+        ),
+        ("Sem endereço, apenas httpx e http:/quebrado", []),
+        ("", []),
+    ],
+)
+def test_extract_http_address_cases(text, expected):
+    assert TextUtils.extract_http_address(text) == expected
+
+
+def test_conversion_results_are_cached():
+    TextUtils.clear_conversion_cache()
+    for _ in range(3):
+        assert TextUtils.to_number_str("3.0") == "3"
+        assert TextUtils.ensure_utf8("Hello \\u00E9") == "Hello é"
+    assert text_utils._float_to_number_str.cache_info().hits == 2
+    assert text_utils._decode_unicode_escapes.cache_info().hits == 2
+    # Tipos distintos com o mesmo valor não compartilham a entrada
+    assert TextUtils.to_number_str(3.0) == "3"
+    assert text_utils._float_to_number_str.cache_info().currsize == 2
+    # Falhas de conversão não ficam em cache
+    assert TextUtils.to_number_str("1,5") == "1,5"
+    assert text_utils._float_to_number_str.cache_info().currsize == 2
+    TextUtils.clear_conversion_cache()
+    assert text_utils._float_to_number_str.cache_info().currsize == 0
+    assert text_utils._decode_unicode_escapes.cache_info().currsize == 0
+
+
+def test_find_word_in_text_reuses_pattern_for_same_words():
+    text_utils._compile_word_trie_re.cache_clear()
+    for _ in range(2):
+        assert TextUtils.find_word_in_text(
+            "Uma caixa", ["caixa", "blister", "caixa"]
+        ) == ("caixa", "Uma")
+    assert text_utils._compile_word_trie_re.cache_info().misses == 1
+
+
+@pytest.mark.parametrize(
+    "key_words, expected",
+    [
+        (["caixa", "caixa com"], ("caixa", "com 120")),
+        (["caixa com", "caixa"], ("caixa com", "120")),
+        (["cai", "caixa com", "caixa"], ("caixa com", "120")),
+    ],
+)
+def test_find_word_in_text_prefers_first_listed_word(key_words, expected):
+    # Palavras possíveis na mesma posição: vale a ordem de `key_words`
+    assert TextUtils.find_word_in_text("caixa com 120", key_words) == expected
+
+
+def test_ensure_utf8_keeps_text_with_invalid_escape():
+    text = "Arquivo \\u00E9 em C:\\users"
+    assert TextUtils.ensure_utf8(text) == text
+
+
+def test_extract_all_dates_as_datetime_logs_invalid_dates(caplog, capsys):
+    with caplog.at_level("DEBUG", logger=text_utils.__name__):
+        assert TextUtils.extract_all_dates_as_datetime("Em 31/02/2024") == []
+    assert "31/02/2024" in caplog.text
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Produto #12 (caixa) - 10mg/ml; lote_A-3.\t",
+        "Coração & Saúde! ×÷ Ελλάδα",
+        "".join(map(chr, range(0x80))),
+        "",
+    ],
+)
+def test_remove_special_characters_preserving_accents(text):
+    assert TextUtils.remove_special_characters_preserving_accents(
+        text
+    ) == re.sub(r"[^\w\sÀ-ÿ]", "", text)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [3, 3.0, 3.5, "0000025.3000000", " -Inf ", "abc", "1,5", "nan"],
+        [1.0, 2.5, float("nan"), 1e20, -0.0, 0.1 + 0.2],
+        [True, False],
+        ["1", " 2 ", "3"],
+        [],
+    ],
+)
+def test_to_number_str_array_matches_to_number_str(values):
+    assert TextUtils.to_number_str_array(values) == [
+        TextUtils.to_number_str(value) for value in values
+    ]
+
+
+def _random_number_columns(rng):
+    return [
+        [str(rng.random()) for _ in range(2000)],
+        [rng.randrange(-(2**63), 2**63) for _ in range(2000)],
+        [rng.random() * 10 ** rng.randrange(-5, 25) for _ in range(2000)],
+        [float(rng.randrange(-(10**6), 10**6)) for _ in range(2000)],
+        [
+            rng.choice([rng.randrange(2**62), rng.random(), str(rng.random())])
+            for _ in range(2000)
+        ],
+    ]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_to_number_str_array_matches_to_number_str_randomized(seed):
+    for values in _random_number_columns(random.Random(seed)):
+        expected = [TextUtils.to_number_str(value) for value in values]
+        assert TextUtils.to_number_str_array(values) == expected
+        assert TextUtils.to_number_str_array(pd.Series(values)) == expected
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["1,5 mg", "sem número", "2,25"],
+        ["1,5", None, "3,2"],
+        ["1,5", 3],
+        [],
+    ],
+)
+def test_replace_comma_with_dot_series(values):
+    series = pd.Series(values, index=range(10, 10 + len(values)), name="v")
+    result = TextUtils.replace_comma_with_dot_series(series)
+    expected = series.str.replace(r"(\d+),(\d+)", r"\1.\2", regex=True)
+    pd.testing.assert_series_equal(result, expected)
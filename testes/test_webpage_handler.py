@@ -1,6 +1,564 @@
-from omniutils.request_handler import RequestHandler
+import asyncio
+import functools
+import http.server
+import io
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import httpx
+import pytest  # type: ignore
+import requests
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests_cache import CachedSession
+from urllib3 import Retry
+
+from omniutils.request_handler import (
+    DEFAULT_RETRIES,
+    DEFAULT_STATUS_FORCELIST,
+    INTERNET_CHECK_ADDRESS,
+    RequestHandler,
+    RetryHTTPAdapter,
+)
 
 
 def test_get_session():
     session = RequestHandler.get_session()
     assert session is not None
+
+
+def test_get_session_mounts_retry_adapter():
+    session = RequestHandler.get_session()
+    adapter = session.get_adapter("https://example.com")
+    assert isinstance(adapter, RetryHTTPAdapter)
+    assert adapter.max_retries.total == DEFAULT_RETRIES
+    assert adapter.max_retries.status_forcelist == DEFAULT_STATUS_FORCELIST
+
+    with adapter.override_retries(Retry(total=10)):
+        assert adapter.max_retries.total == 10
+    assert adapter.max_retries.total == DEFAULT_RETRIES
+
+
+def test_get_soap_from_file(tmp_path):
+    file_path = tmp_path / "pagina.html"
+    file_path.write_text(
+        "<html><head><title>Olá Mundo</title></head></html>", encoding="utf-8"
+    )
+    soup = RequestHandler.get_soap_from_file(str(file_path))
+    assert soup.title.text == "Olá Mundo"
+
+
+def test_get_soap_from_empty_file(tmp_path):
+    file_path = tmp_path / "vazio.html"
+    file_path.write_text("  \n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        RequestHandler.get_soap_from_file(str(file_path))
+
+
+class DummyStreamResponse:
+    def __init__(self, content: bytes):
+        self.content = content
+        self.closed = False
+        self.headers = {"Content-Type": "text/html; charset=utf-8"}
+        self.encoding = "utf-8"
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.content), chunk_size):
+            end = start + chunk_size
+            yield self.content[start:end]
+
+    def close(self):
+        self.closed = True
+
+
+def test_get_elements_streaming(monkeypatch):
+    links = "".join(
+        f'<li><a href="/pagina/{i}">{i}</a></li>' for i in range(50)
+    )
+    response = DummyStreamResponse(
+        f"<html><head><title>Título</title></head><body><ul>{links}</ul>"
+        "</body></html>".encode("utf-8")
+    )
+    monkeypatch.setattr(
+        RequestHandler,
+        "request_with_retry",
+        lambda url, **kwargs: response,
+    )
+
+    elements = [
+        (element.tag, element.get("href"), element.text)
+        for element in RequestHandler.get_elements_streaming(
+            "https://example.com", tags=("a", "title"), chunk_size=64
+        )
+    ]
+    assert elements[0] == ("title", None, "Título")
+    assert elements[1:] == [("a", f"/pagina/{i}", str(i)) for i in range(50)]
+    assert response.closed
+
+
+def test_get_session_sqlite_cache_pragmas():
+    session = RequestHandler.get_session()
+    with session.cache.responses.connection() as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        assert connection.execute("PRAGMA busy_timeout").fetchone()[0] > 0
+
+
+def test_get_session_is_created_once_across_threads(monkeypatch):
+    monkeypatch.setattr(RequestHandler, "_session", None)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sessions = list(
+            executor.map(lambda _: RequestHandler.get_session(), range(16))
+        )
+    assert all(session is sessions[0] for session in sessions)
+
+
+class DummyRawResponse:
+    def __init__(self, content: bytes):
+        self.raw = io.BytesIO(content)
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def test_download_file(tmp_path, monkeypatch):
+    content = bytes(range(256)) * 8192  # 2 MB, mais de um bloco
+    response = DummyRawResponse(content)
+    monkeypatch.setattr(
+        RequestHandler,
+        "request_with_retry",
+        lambda url, **kwargs: response,
+    )
+
+    filename_path = tmp_path / "downloads" / "arquivo.bin"
+    result = RequestHandler.download_file(
+        "https://example.com/arquivo.bin", str(filename_path)
+    )
+    assert result == str(filename_path)
+    assert filename_path.read_bytes() == content
+    assert response.closed
+
+
+def test_download_file_recreates_removed_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        RequestHandler,
+        "request_with_retry",
+        lambda url, **kwargs: DummyRawResponse(b"conteudo"),
+    )
+    lote = tmp_path / "lote"
+
+    RequestHandler.download_file(
+        "https://example.com/arquivo.bin", str(lote / "a@1.bin")
+    )
+    assert (lote / "a_1.bin").read_bytes() == b"conteudo"
+
+    # A pasta de saída limpa entre lotes é criada novamente
+    shutil.rmtree(lote)
+    RequestHandler.download_file(
+        "https://example.com/arquivo.bin", str(lote / "b.bin")
+    )
+    assert (lote / "b.bin").read_bytes() == b"conteudo"
+
+
+def test_show_cache_info(tmp_path, monkeypatch, caplog):
+    (tmp_path / "pagina.html").write_bytes(b"<html>" + b"a" * 1024 + b"</html>")
+    handler = functools.partial(
+        http.server.SimpleHTTPRequestHandler, directory=str(tmp_path)
+    )
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        session = CachedSession(str(tmp_path / "cache.sqlite"))
+        url = f"http://127.0.0.1:{server.server_port}/pagina.html"
+        session.get(url)
+        monkeypatch.setattr(RequestHandler, "_session", session)
+
+        with caplog.at_level("INFO"):
+            RequestHandler.show_cache_info(show_urls=True)
+    finally:
+        server.shutdown()
+
+    assert "Número de requisições armazenadas: 1;" in caplog.text
+    assert url in caplog.text
+
+
+def test_get_last_modified_is_memoized(monkeypatch):
+    calls = {"internet": 0, "find_date": 0}
+
+    def dummy_check_internet_access(*args, **kwargs):
+        calls["internet"] += 1
+        return True
+
+    def dummy_find_date(url, outputformat):  # pylint: disable=unused-argument
+        calls["find_date"] += 1
+        return "2024-01-15"
+
+    monkeypatch.setattr(
+        RequestHandler, "check_internet_access", dummy_check_internet_access
+    )
+    monkeypatch.setattr(RequestHandler, "_internet_checked_at", None)
+    monkeypatch.setattr(
+        RequestHandler,
+        "_get_header_last_modified",
+        classmethod(lambda cls, url: None),
+    )
+    monkeypatch.setattr(
+        "omniutils.request_handler.htmldate.find_date", dummy_find_date
+    )
+    RequestHandler._find_date.cache_clear()  # pylint: disable=no-member
+
+    url = "https://example.com/memoized"
+    for _ in range(3):
+        assert RequestHandler.get_last_modified(url) == datetime(2024, 1, 15)
+    assert calls == {"internet": 1, "find_date": 1}
+    RequestHandler._find_date.cache_clear()  # pylint: disable=no-member
+
+
+def test_get_last_modified_does_not_memoize_failures(monkeypatch):
+    results = [None, "2024-01-15"]
+
+    def dummy_find_date(url, outputformat):  # pylint: disable=unused-argument
+        return results.pop(0)
+
+    monkeypatch.setattr(
+        RequestHandler, "check_internet_access", lambda *args: True
+    )
+    monkeypatch.setattr(RequestHandler, "_internet_checked_at", None)
+    monkeypatch.setattr(
+        RequestHandler,
+        "_get_header_last_modified",
+        classmethod(lambda cls, url: None),
+    )
+    monkeypatch.setattr(
+        "omniutils.request_handler.htmldate.find_date", dummy_find_date
+    )
+    RequestHandler._find_date.cache_clear()  # pylint: disable=no-member
+
+    # Uma falha (temporária) não impede que a data seja obtida depois
+    url = "https://example.com/falha-temporaria"
+    assert RequestHandler.get_last_modified(url) is None
+    assert RequestHandler.get_last_modified(url) == datetime(2024, 1, 15)
+    assert not results
+    RequestHandler._find_date.cache_clear()  # pylint: disable=no-member
+
+
+def test_check_internet_access_uses_tcp_probe(monkeypatch):
+    addresses = []
+
+    class DummySocket:
+        def close(self):
+            pass
+
+    def dummy_create_connection(address, timeout):
+        addresses.append((address, timeout))
+        return DummySocket()
+
+    monkeypatch.setattr(
+        "omniutils.request_handler.socket.create_connection",
+        dummy_create_connection,
+    )
+    assert RequestHandler.check_internet_access(timeout=3) is True
+    assert addresses == [(INTERNET_CHECK_ADDRESS, 3)]
+
+
+def test_check_internet_access_tcp_probe_failure(monkeypatch):
+    def dummy_create_connection(address, timeout):
+        raise OSError("Network is unreachable")
+
+    monkeypatch.setattr(
+        "omniutils.request_handler.socket.create_connection",
+        dummy_create_connection,
+    )
+    with pytest.raises(RequestsConnectionError):
+        RequestHandler.check_internet_access()
+
+
+def test_get_soap_by_url_reuses_parsed_soup(monkeypatch):
+    class DummyCachedResponse:
+        content = b"<html><head><title>Cache</title></head></html>"
+        headers: dict = {}
+        from_cache = True
+        cache_key = "dummy-key"
+        created_at = datetime(2024, 1, 15)
+
+    monkeypatch.setattr(
+        RequestHandler,
+        "request_with_retry",
+        classmethod(lambda cls, url: DummyCachedResponse()),
+    )
+    monkeypatch.setattr(RequestHandler, "_soup_cache", OrderedDict())
+    url = "https://example.com/cache"
+
+    soup = RequestHandler.get_soap_by_url(url, reuse_tree=True)
+    assert soup.title.text == "Cache"
+    assert RequestHandler.get_soap_by_url(url, reuse_tree=True) is soup
+
+    # Uma nova versão da página armazenada no cache gera uma nova árvore
+    DummyCachedResponse.created_at = datetime(2024, 1, 16)
+    assert RequestHandler.get_soap_by_url(url, reuse_tree=True) is not soup
+
+
+def test_get_soap_by_url_does_not_share_tree_by_default(monkeypatch):
+    class DummyCachedResponse:
+        content = b"<html><head><title>Cache</title></head></html>"
+        headers: dict = {}
+        from_cache = True
+        cache_key = "dummy-key"
+        created_at = datetime(2024, 1, 15)
+
+    monkeypatch.setattr(
+        RequestHandler,
+        "request_with_retry",
+        classmethod(lambda cls, url: DummyCachedResponse()),
+    )
+    monkeypatch.setattr(RequestHandler, "_soup_cache", OrderedDict())
+    url = "https://example.com/cache"
+
+    # Um chamador que altera a árvore não afeta as chamadas seguintes
+    RequestHandler.get_soap_by_url(url).title.decompose()
+    soup = RequestHandler.get_soap_by_url(url)
+    assert soup.title.text == "Cache"
+    assert not RequestHandler._soup_cache
+
+
+def test_cache_totals_for_non_sqlite_backend():
+    class DummyResponse:
+        def __init__(self, content):
+            self.content = content
+
+    responses = {"a": DummyResponse(b"x" * 10), "b": DummyResponse(b"y" * 5)}
+    # pylint: disable=protected-access
+    assert RequestHandler._get_cache_totals(responses) == (2, 15)
+    assert sorted(RequestHandler._iter_cache_sizes(responses)) == [
+        ("a", 10),
+        ("b", 5),
+    ]
+
+
+class FlakyHandler(http.server.BaseHTTPRequestHandler):
+    """Responde 503 na primeira requisição e 200 nas seguintes."""
+
+    calls = 0
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        FlakyHandler.calls += 1
+        status = 503 if FlakyHandler.calls == 1 else 200
+        body = b"<html><title>ok</title></html>"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture
+def flaky_server():
+    FlakyHandler.calls = 0
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+
+
+def test_request_with_retry_http2_retries_status(flaky_server):
+    response = RequestHandler.request_with_retry(
+        flaky_server, use_http2=True, backoff_factor=0
+    )
+    assert isinstance(response, httpx.Response)
+    assert response.status_code == 200
+    assert FlakyHandler.calls == 2
+    assert (
+        RequestHandler.get_http2_client() is RequestHandler.get_http2_client()
+    )
+
+
+def test_request_with_retry_http2_raises_http_error(flaky_server):
+    with pytest.raises(requests.exceptions.HTTPError):
+        RequestHandler.request_with_retry(
+            flaky_server, use_http2=True, retries=0
+        )
+
+
+@pytest.fixture
+def file_server(tmp_path):
+    served = tmp_path / "servidor"
+    served.mkdir()
+    for name in ("a", "b", "c"):
+        (served / f"{name}.html").write_bytes(name.encode() * 2048)
+    handler = functools.partial(
+        http.server.SimpleHTTPRequestHandler, directory=str(served)
+    )
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_get_many(file_server):
+    urls = [f"{file_server}/{name}.html" for name in ("a", "b", "c")]
+    responses = asyncio.run(RequestHandler.get_many(urls, concurrency=2))
+    assert [response.content for response in responses] == [
+        b"a" * 2048,
+        b"b" * 2048,
+        b"c" * 2048,
+    ]
+
+
+def test_download_many(file_server, tmp_path):
+    downloads = [
+        (f"{file_server}/{name}.html", str(tmp_path / "destino" / name))
+        for name in ("a", "b", "c")
+    ]
+    paths = asyncio.run(RequestHandler.download_many(downloads))
+    assert paths == [path for _, path in downloads]
+    assert (tmp_path / "destino" / "b").read_bytes() == b"b" * 2048
+
+    with pytest.raises(requests.exceptions.HTTPError) as excinfo:
+        asyncio.run(
+            RequestHandler.download_many(
+                [(f"{file_server}/x.html", str(tmp_path / "x"))]
+            )
+        )
+    assert isinstance(excinfo.value.response, httpx.Response)
+
+
+class TruncatedHandler(http.server.BaseHTTPRequestHandler):
+    """Anuncia um corpo maior do que o enviado e encerra a conexão."""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.send_response(200)
+        self.send_header("Content-Length", "100000")
+        self.end_headers()
+        self.wfile.write(b"x" * 1024)
+        self.close_connection = True
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def test_download_many_removes_partial_files(file_server, tmp_path):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), TruncatedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    truncated_url = f"http://127.0.0.1:{server.server_port}/grande.bin"
+    destino = tmp_path / "destino"
+    downloads = [
+        (f"{file_server}/a.html", str(destino / "a")),
+        (truncated_url, str(destino / "grande")),
+        (f"{file_server}/c.html", str(destino / "c")),
+    ]
+    try:
+        with pytest.raises(RequestsConnectionError):
+            asyncio.run(RequestHandler.download_many(downloads))
+    finally:
+        server.shutdown()
+
+    # Os demais downloads terminam, e o arquivo truncado é excluído
+    assert (destino / "a").read_bytes() == b"a" * 2048
+    assert (destino / "c").read_bytes() == b"c" * 2048
+    assert not (destino / "grande").exists()
+
+
+def test_get_soap_by_url_only_tags(monkeypatch):
+    class DummyResponse:
+        content = (
+            b"<html><head><title>Titulo</title></head><body>"
+            b"<p>texto</p><a href='/x'>link</a></body></html>"
+        )
+        headers: dict = {}
+        from_cache = False
+
+    monkeypatch.setattr(
+        RequestHandler,
+        "request_with_retry",
+        classmethod(lambda cls, url: DummyResponse()),
+    )
+
+    soup = RequestHandler.get_soap_by_url(
+        "https://example.com/strainer", only_tags=["title", "a"]
+    )
+    assert soup.title.text == "Titulo"
+    assert soup.a["href"] == "/x"
+    assert soup.p is None
+
+
+@pytest.mark.parametrize(
+    "content_type, content",
+    [
+        (
+            "text/html; charset=utf-8",
+            "<html><title>Ação</title></html>".encode("utf-8"),
+        ),
+        (
+            "text/html",
+            '<html><head><meta charset="utf-8"><title>Ação</title></head>'
+            "</html>".encode("utf-8"),
+        ),
+    ],
+)
+def test_get_soap_by_url_uses_declared_encoding(
+    monkeypatch, content_type, content
+):
+    response = requests.Response()
+    response._content = content  # pylint: disable=protected-access
+    response.headers["Content-Type"] = content_type
+    response.encoding = requests.utils.get_encoding_from_headers(
+        response.headers
+    )
+
+    monkeypatch.setattr(
+        RequestHandler,
+        "request_with_retry",
+        classmethod(lambda cls, url: response),
+    )
+
+    soup = RequestHandler.get_soap_by_url("https://example.com/encoding")
+    assert soup.title.text == "Ação"
+
+
+def test_bulk_scrape(file_server, tmp_path, monkeypatch):
+    session = CachedSession(str(tmp_path / "bulk.sqlite"))
+    monkeypatch.setattr(RequestHandler, "_session", session)
+
+    with RequestHandler.bulk_scrape():
+        for name in ("a", "b", "c"):
+            RequestHandler.request_with_retry(f"{file_server}/{name}.html")
+
+    assert len(list(session.cache.responses.keys())) == 3
+    response = RequestHandler.request_with_retry(f"{file_server}/a.html")
+    assert response.from_cache
+
+
+def test_get_last_modified_uses_header(file_server, tmp_path, monkeypatch):
+    # O SimpleHTTPRequestHandler informa a data de modificação do arquivo no
+    # cabeçalho Last-Modified
+    served = tmp_path / "servidor" / "a.html"
+    timestamp = datetime(2023, 5, 20, 12, 0).timestamp()
+    os.utime(served, (timestamp, timestamp))
+
+    def fail_find_date(*args, **kwargs):
+        raise AssertionError("htmldate não deveria ser chamado")
+
+    monkeypatch.setattr(
+        RequestHandler, "check_internet_access", lambda *args: True
+    )
+    monkeypatch.setattr(RequestHandler, "_internet_checked_at", None)
+    monkeypatch.setattr(
+        "omniutils.request_handler.htmldate.find_date", fail_find_date
+    )
+    RequestHandler._find_date.cache_clear()  # pylint: disable=no-member
+
+    assert RequestHandler.get_last_modified(
+        f"{file_server}/a.html"
+    ) == datetime(2023, 5, 20)
+    RequestHandler._find_date.cache_clear()  # pylint: disable=no-member